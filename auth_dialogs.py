@@ -4,74 +4,132 @@ Authentication dialog components for the Dynamic Ollama Assistant GUI.
 This module contains dialog classes for authentication workflows.
 """
 
+import re
+import threading
 import tkinter as tk
 from tkinter import messagebox, ttk
 import webbrowser
 
 
-class ManualSelectorDialog:
+_HELP_TEXT_MANUAL = """1. Open the login page in your browser
+2. Right-click on the username field → "Inspect Element"
+3. Copy the CSS selector (right-click element → Copy → Copy selector)
+4. Repeat for password field and submit button
+5. Common patterns: input[name="email"], #password, button[type="submit"]"""
+
+_INSTRUCTIONS_VERIFICATION = """This site requires human verification (CAPTCHA, "I'm not a robot", etc.) which cannot be automated.
+
+Options to proceed:
+1. Manual Login: Complete the verification manually in your browser, then try scraping
+2. Session Import: If you have valid cookies/session data, import them
+3. Alternative Approach: Some sites offer API access or different login methods
+
+Common verification types detected:
+• reCAPTCHA ("I'm not a robot" checkbox)
+• hCaptcha (image/text challenges)  
+• Cloudflare bot protection
+• Custom verification challenges"""
+
+# Splits pasted URL lists on newlines, trimming surrounding spaces/tabs
+_URL_SPLIT = re.compile(r"[^\S\r\n]*\n[^\S\r\n]*")
+
+# Attribute on the parent window holding its screen dimensions, queried once and
+# reused by every dialog; it lives and dies with the widget itself
+_SCREEN_SIZE_ATTR = "_auth_dialog_screen_size"
+
+
+def _centered_geometry(parent, width, height):
+    """Return a geometry string centering a width x height window on screen."""
+    screen_size = getattr(parent, _SCREEN_SIZE_ATTR, None)
+    if screen_size is None:
+        screen_size = (parent.winfo_screenwidth(), parent.winfo_screenheight())
+        setattr(parent, _SCREEN_SIZE_ATTR, screen_size)
+    screen_width, screen_height = screen_size
+    x = (screen_width // 2) - (width // 2)
+    y = (screen_height // 2) - (height // 2)
+    return f"{width}x{height}+{x}+{y}"
+
+
+class _BaseDialog:
+    """Shared Toplevel setup for the modal authentication dialogs."""
+
+    def __init__(self, parent):
+        self.parent = parent
+        self.dialog = None
+
+    def _make_toplevel(self, title, width, height):
+        """Create a modal Toplevel centered on screen."""
+        dialog = tk.Toplevel(self.parent)
+        dialog.title(title)
+        dialog.transient(self.parent)
+        dialog.grab_set()
+        dialog.geometry(_centered_geometry(self.parent, width, height))
+        return dialog
+
+
+class ManualSelectorDialog(_BaseDialog):
     """Dialog for manual CSS selector entry when sites block automated analysis."""
 
     def __init__(self, parent, error_info, url):
-        self.parent = parent
+        super().__init__(parent)
         self.error_info = error_info
         self.url = url
-        self.dialog = None
+        self.main_frame = None
+        self.button_frame = None
         self.entries = {}
 
     def show(self):
         """Show the manual selector dialog."""
-        self.dialog = tk.Toplevel(self.parent)
-        self.dialog.title("Manual Selector Entry - Site Blocks Analysis")
-        self.dialog.transient(self.parent)
-        self.dialog.grab_set()
+        self.dialog = self._make_toplevel(
+            "Manual Selector Entry - Site Blocks Analysis", 700, 500
+        )
 
-        # Center the dialog
-        self.dialog.update_idletasks()
-        x = (self.dialog.winfo_screenwidth() // 2) - (700 // 2)
-        y = (self.dialog.winfo_screenheight() // 2) - (500 // 2)
-        self.dialog.geometry(f"700x500+{x}+{y}")
+        self._create_widgets_critical()
+        self.dialog.after_idle(self._create_widgets_deferred)
 
-        self._create_widgets()
-
-    def _create_widgets(self):
-        """Create dialog widgets."""
-        main_frame = ttk.Frame(self.dialog, padding="10")
-        main_frame.pack(fill="both", expand=True)
+    def _create_widgets_critical(self):
+        """Create the widgets needed for the dialog's first paint."""
+        self.main_frame = ttk.Frame(self.dialog, padding="10")
+        self.main_frame.pack(fill="both", expand=True)
 
         # Error explanation
         ttk.Label(
-            main_frame,
+            self.main_frame,
             text="⚠️ Site Blocks Automated Analysis",
             font=("Arial", 14, "bold"),
             foreground="#ff6b35",
         ).pack(pady=(0, 10))
 
         # Error details
-        self._create_error_section(main_frame)
-        
+        self._create_error_section(self.main_frame)
+
         # Manual entry section
-        self._create_manual_entry_section(main_frame)
-        
-        # Help section
-        self._create_help_section(main_frame)
-        
+        self._create_manual_entry_section(self.main_frame)
+
         # Buttons
-        self._create_buttons(main_frame)
+        self._create_buttons(self.main_frame)
+
+    def _create_widgets_deferred(self):
+        """Create secondary widgets once the dialog is already visible."""
+        if not self.dialog.winfo_exists():
+            return
+
+        # Help section
+        self._create_help_section(self.main_frame)
 
     def _create_error_section(self, parent):
         """Create error details section."""
         error_frame = ttk.LabelFrame(parent, text="Error Details", padding="10")
         error_frame.pack(fill="x", pady=(0, 15))
 
-        error_text = tk.Text(
-            error_frame, height=3, wrap="word", background="#2b2b2b", foreground="white"
-        )
-        error_text.pack(fill="x")
-        error_text.insert(
-            "1.0", f"{self.error_info['error']}\n\n{self.error_info.get('suggestion', '')}"
-        )
-        error_text.config(state="disabled")
+        ttk.Label(
+            error_frame,
+            text=f"{self.error_info['error']}\n\n{self.error_info.get('suggestion', '')}",
+            wraplength=640,
+            justify="left",
+            background="#2b2b2b",
+            foreground="white",
+        ).pack(fill="x")
 
     def _create_manual_entry_section(self, parent):
         """Create manual selector entry section."""
@@ -85,54 +143,58 @@ class ManualSelectorDialog:
             manual_frame,
             text="Enter CSS selectors manually by inspecting the login page:",
             font=("Arial", 10, "bold"),
-        ).pack(anchor="w", pady=(0, 10))
-
-        # Selector entries
-        common_selectors = self.error_info.get("common_selectors", {})
-
-        for field, placeholder in [
-            ("username", "Username/Email field selector"),
-            ("password", "Password field selector"),
-            ("submit", "Submit button selector"),
-        ]:
-            field_frame = ttk.Frame(manual_frame)
-            field_frame.pack(fill="x", pady=5)
-
-            ttk.Label(field_frame, text=f"{field.title()}:", width=12).pack(side="left")
-            entry = ttk.Entry(field_frame, width=50)
-            entry.pack(side="left", fill="x", expand=True, padx=(5, 0))
+        ).grid(row=0, column=0, columnspan=2, sticky="w", pady=(0, 10))
+
+        # Selector entries, pre-filled with the first suggestion for each field
+        first_selectors = {
+            field: suggestions.split(",", 1)[0].strip()
+            for field, suggestions in self.error_info.get(
+                "common_selectors", {}
+            ).items()
+        }
+
+        for row, (field, placeholder) in enumerate(
+            [
+                ("username", "Username/Email field selector"),
+                ("password", "Password field selector"),
+                ("submit", "Submit button selector"),
+            ],
+            start=1,
+        ):
+            ttk.Label(manual_frame, text=f"{field.title()}:", width=12).grid(
+                row=row, column=0, sticky="w", pady=5
+            )
+            entry = ttk.Entry(manual_frame, width=50)
+            entry.grid(row=row, column=1, sticky="ew", padx=(5, 0), pady=5)
 
-            # Pre-fill with common selector suggestions
-            if field in common_selectors:
-                entry.insert(0, common_selectors[field].split(",")[0].strip())
+            if field in first_selectors:
+                entry.insert(0, first_selectors[field])
 
             self.entries[field] = entry
 
+        manual_frame.columnconfigure(1, weight=1)
+
     def _create_help_section(self, parent):
         """Create help section."""
         help_frame = ttk.LabelFrame(
             parent, text="How to Find Selectors", padding="10"
         )
-        help_frame.pack(fill="x", pady=(10, 0))
+        help_frame.pack(fill="x", pady=(10, 0), before=self.button_frame)
 
-        help_text = tk.Text(
-            help_frame, height=6, wrap="word", background="#2b2b2b", foreground="white"
-        )
-        help_text.pack(fill="x")
-        help_text.insert(
-            "1.0",
-            """1. Open the login page in your browser
-2. Right-click on the username field → "Inspect Element"
-3. Copy the CSS selector (right-click element → Copy → Copy selector)
-4. Repeat for password field and submit button
-5. Common patterns: input[name="email"], #password, button[type="submit"]""",
-        )
-        help_text.config(state="disabled")
+        ttk.Label(
+            help_frame,
+            text=_HELP_TEXT_MANUAL,
+            wraplength=640,
+            justify="left",
+            background="#2b2b2b",
+            foreground="white",
+        ).pack(fill="x")
 
     def _create_buttons(self, parent):
         """Create dialog buttons."""
         button_frame = ttk.Frame(parent)
         button_frame.pack(fill="x", pady=(10, 0))
+        self.button_frame = button_frame
 
         def use_manual_selectors():
             selectors = {}
@@ -146,8 +208,11 @@ class ManualSelectorDialog:
                 self.parent.ui.login_selectors = selectors
                 self.parent._update_auth_button_states()
                 self.dialog.destroy()
-                messagebox.showinfo(
-                    "Success", "Manual selectors saved! You can now use Login & Scrape."
+                self.parent.after_idle(
+                    lambda: messagebox.showinfo(
+                        "Success",
+                        "Manual selectors saved! You can now use Login & Scrape.",
+                    )
                 )
             else:
                 messagebox.showerror(
@@ -155,7 +220,9 @@ class ManualSelectorDialog:
                 )
 
         def open_browser():
-            webbrowser.open(self.url)
+            threading.Thread(
+                target=webbrowser.open, args=(self.url,), daemon=True
+            ).start()
 
         ttk.Button(button_frame, text="Open Login Page", command=open_browser).pack(
             side="left"
@@ -168,128 +235,114 @@ class ManualSelectorDialog:
         ).pack(side="right", padx=(0, 10))
 
 
-class VerificationRequiredDialog:
+class VerificationRequiredDialog(_BaseDialog):
     """Dialog for when CAPTCHA or human verification is detected."""
 
     def __init__(self, parent, verification_info, url):
-        self.parent = parent
+        super().__init__(parent)
         self.verification_info = verification_info
         self.url = url
-        self.dialog = None
+        self.main_frame = None
+        self.button_frame = None
 
     def show(self):
         """Show the verification required dialog."""
-        self.dialog = tk.Toplevel(self.parent)
-        self.dialog.title("Human Verification Required")
-        self.dialog.transient(self.parent)
-        self.dialog.grab_set()
+        self.dialog = self._make_toplevel("Human Verification Required", 600, 400)
 
-        # Center the dialog
-        self.dialog.update_idletasks()
-        x = (self.dialog.winfo_screenwidth() // 2) - (600 // 2)
-        y = (self.dialog.winfo_screenheight() // 2) - (400 // 2)
-        self.dialog.geometry(f"600x400+{x}+{y}")
+        self._create_widgets_critical()
+        self.dialog.after_idle(self._create_widgets_deferred)
 
-        self._create_widgets()
-
-    def _create_widgets(self):
-        """Create dialog widgets."""
-        main_frame = ttk.Frame(self.dialog, padding="10")
-        main_frame.pack(fill="both", expand=True)
+    def _create_widgets_critical(self):
+        """Create the widgets needed for the dialog's first paint."""
+        self.main_frame = ttk.Frame(self.dialog, padding="10")
+        self.main_frame.pack(fill="both", expand=True)
 
         # Warning header
         ttk.Label(
-            main_frame,
+            self.main_frame,
             text="🤖 Human Verification Detected",
             font=("Arial", 14, "bold"),
             foreground="#ff6b35",
         ).pack(pady=(0, 10))
 
+        # Buttons
+        self._create_buttons(self.main_frame)
+
+    def _create_widgets_deferred(self):
+        """Create secondary widgets once the dialog is already visible."""
+        if not self.dialog.winfo_exists():
+            return
+
         # Verification details
-        self._create_details_section(main_frame)
-        
+        self._create_details_section(self.main_frame)
+
         # Instructions
-        self._create_instructions_section(main_frame)
-        
-        # Buttons
-        self._create_buttons(main_frame)
+        self._create_instructions_section(self.main_frame)
 
     def _create_details_section(self, parent):
         """Create verification details section."""
         details_frame = ttk.LabelFrame(
             parent, text="Verification Details", padding="10"
         )
-        details_frame.pack(fill="x", pady=(0, 15))
-
-        details_text = tk.Text(
-            details_frame,
-            height=4,
-            wrap="word",
-            background="#2b2b2b",
-            foreground="white",
-        )
-        details_text.pack(fill="x")
-
-        details_content = f"Site: {self.verification_info.get('current_url', self.url)}\n"
-        details_content += (
-            f"Page Title: {self.verification_info.get('page_title', 'Unknown')}\n\n"
-        )
+        details_frame.pack(fill="x", pady=(0, 15), before=self.button_frame)
 
+        parts = [
+            f"Site: {self.verification_info.get('current_url', self.url)}",
+            f"Page Title: {self.verification_info.get('page_title', 'Unknown')}",
+            "",
+        ]
         if self.verification_info.get("content_matches"):
-            details_content += (
+            parts.append(
                 f"Detected: {', '.join(self.verification_info['content_matches'][:3])}"
             )
 
-        details_text.insert("1.0", details_content)
-        details_text.config(state="disabled")
+        ttk.Label(
+            details_frame,
+            text="\n".join(parts),
+            wraplength=540,
+            justify="left",
+            background="#2b2b2b",
+            foreground="white",
+        ).pack(fill="x")
 
     def _create_instructions_section(self, parent):
         """Create instructions section."""
         instructions_frame = ttk.LabelFrame(
             parent, text="What This Means", padding="10"
         )
-        instructions_frame.pack(fill="both", expand=True, pady=(0, 15))
+        instructions_frame.pack(
+            fill="both", expand=True, pady=(0, 15), before=self.button_frame
+        )
 
-        instructions_text = tk.Text(
+        ttk.Label(
             instructions_frame,
-            height=8,
-            wrap="word",
+            text=_INSTRUCTIONS_VERIFICATION,
+            wraplength=540,
+            justify="left",
             background="#2b2b2b",
             foreground="white",
-        )
-        instructions_text.pack(fill="x")
-        instructions_text.insert(
-            "1.0",
-            """This site requires human verification (CAPTCHA, "I'm not a robot", etc.) which cannot be automated.
-
-Options to proceed:
-1. Manual Login: Complete the verification manually in your browser, then try scraping
-2. Session Import: If you have valid cookies/session data, import them
-3. Alternative Approach: Some sites offer API access or different login methods
-
-Common verification types detected:
-• reCAPTCHA ("I'm not a robot" checkbox)
-• hCaptcha (image/text challenges)  
-• Cloudflare bot protection
-• Custom verification challenges""",
-        )
-        instructions_text.config(state="disabled")
+        ).pack(fill="x")
 
     def _create_buttons(self, parent):
         """Create dialog buttons."""
         button_frame = ttk.Frame(parent)
         button_frame.pack(fill="x", pady=(10, 0))
+        self.button_frame = button_frame
 
         def open_site():
-            webbrowser.open(self.url)
+            threading.Thread(
+                target=webbrowser.open, args=(self.url,), daemon=True
+            ).start()
 
         def try_anyway():
             """Allow user to attempt login despite verification detection."""
             self.dialog.destroy()
             # Continue with normal login flow
-            messagebox.showinfo(
-                "Proceeding",
-                "Attempting login despite verification detection. Manual intervention may be required.",
+            self.parent.after_idle(
+                lambda: messagebox.showinfo(
+                    "Proceeding",
+                    "Attempting login despite verification detection. Manual intervention may be required.",
+                )
             )
 
         ttk.Button(button_frame, text="Open Site Manually", command=open_site).pack(
@@ -303,27 +356,17 @@ Common verification types detected:
         )
 
 
-class LoginAnalysisDialog:
+class LoginAnalysisDialog(_BaseDialog):
     """Dialog for showing login form analysis results."""
 
     def __init__(self, parent, selectors, url):
-        self.parent = parent
+        super().__init__(parent)
         self.selectors = selectors
         self.url = url
-        self.dialog = None
 
     def show(self):
         """Show the login analysis dialog."""
-        self.dialog = tk.Toplevel(self.parent)
-        self.dialog.title("Login Form Analysis")
-        self.dialog.transient(self.parent)
-        self.dialog.grab_set()
-
-        # Center the dialog
-        self.dialog.update_idletasks()
-        x = (self.dialog.winfo_screenwidth() // 2) - (600 // 2)
-        y = (self.dialog.winfo_screenheight() // 2) - (400 // 2)
-        self.dialog.geometry(f"600x400+{x}+{y}")
+        self.dialog = self._make_toplevel("Login Form Analysis", 600, 400)
 
         self._create_widgets()
 
@@ -342,18 +385,19 @@ class LoginAnalysisDialog:
         results_frame = ttk.LabelFrame(main_frame, text="Detected Selectors", padding="10")
         results_frame.pack(fill="both", expand=True, pady=(0, 10))
 
-        results_text = tk.Text(
-            results_frame, wrap="word", background="#2b2b2b", foreground="white"
-        )
-        results_text.pack(fill="both", expand=True)
-
         # Display selectors
-        content = "AI Analysis Results:\n\n"
-        for field, selector in self.selectors.items():
-            content += f"{field.title()}: {selector}\n"
-
-        results_text.insert("1.0", content)
-        results_text.config(state="disabled")
+        content = "AI Analysis Results:\n\n" + "\n".join(
+            f"{field.title()}: {selector}" for field, selector in self.selectors.items()
+        )
+        ttk.Label(
+            results_frame,
+            text=content,
+            wraplength=540,
+            justify="left",
+            anchor="nw",
+            background="#2b2b2b",
+            foreground="white",
+        ).pack(fill="both", expand=True)
 
         # Buttons
         button_frame = ttk.Frame(main_frame)
@@ -373,12 +417,13 @@ class LoginAnalysisDialog:
         )
 
 
-class NavigationDialog:
+class NavigationDialog(_BaseDialog):
     """Dialog for navigating authenticated sites."""
 
     def __init__(self, parent):
-        self.parent = parent
-        self.dialog = None
+        super().__init__(parent)
+        self.main_frame = None
+        self.options_frame = None
 
     def show(self):
         """Show the navigation dialog."""
@@ -389,23 +434,16 @@ class NavigationDialog:
             messagebox.showerror("Error", "Please login first using 'Login & Scrape'.")
             return
 
-        self.dialog = tk.Toplevel(self.parent)
-        self.dialog.title("Navigate Authenticated Site")
-        self.dialog.transient(self.parent)
-        self.dialog.grab_set()
-
-        # Center the dialog
-        self.dialog.update_idletasks()
-        x = (self.dialog.winfo_screenwidth() // 2) - (500 // 2)
-        y = (self.dialog.winfo_screenheight() // 2) - (400 // 2)
-        self.dialog.geometry(f"500x400+{x}+{y}")
+        self.dialog = self._make_toplevel("Navigate Authenticated Site", 500, 400)
 
-        self._create_widgets()
+        self._create_widgets_critical()
+        self.dialog.after_idle(self._create_widgets_deferred)
 
-    def _create_widgets(self):
-        """Create dialog widgets."""
+    def _create_widgets_critical(self):
+        """Create the widgets needed for the dialog's first paint."""
         main_frame = ttk.Frame(self.dialog, padding="10")
         main_frame.pack(fill="both", expand=True)
+        self.main_frame = main_frame
 
         ttk.Label(
             main_frame,
@@ -434,21 +472,10 @@ class NavigationDialog:
         url_text.pack(side="left", fill="both", expand=True)
         url_scrollbar.pack(side="right", fill="y")
 
-        # Example URLs
-        example_frame = ttk.LabelFrame(main_frame, text="Example", padding="5")
-        example_frame.pack(fill="x", pady=(0, 10))
-
-        example_text = tk.Text(example_frame, height=3, wrap="word")
-        example_text.pack(fill="x")
-        example_text.insert(
-            "1.0",
-            "https://example.com/dashboard\nhttps://example.com/profile\nhttps://example.com/settings",
-        )
-        example_text.config(state="disabled")
-
         # Options
         options_frame = ttk.LabelFrame(main_frame, text="Options", padding="5")
         options_frame.pack(fill="x", pady=(0, 10))
+        self.options_frame = options_frame
 
         wait_var = tk.BooleanVar(value=True)
         ttk.Checkbutton(
@@ -465,7 +492,7 @@ class NavigationDialog:
                 messagebox.showerror("Error", "Please enter at least one URL.")
                 return
 
-            urls = [url.strip() for url in urls_text.split("\n") if url.strip()]
+            urls = [url for url in _URL_SPLIT.split(urls_text) if url]
             if not urls:
                 messagebox.showerror("Error", "Please enter valid URLs.")
                 return
@@ -479,3 +506,19 @@ class NavigationDialog:
         ttk.Button(
             button_frame, text="Start Navigation", command=start_navigation
         ).pack(side="right")
+
+    def _create_widgets_deferred(self):
+        """Create secondary widgets once the dialog is already visible."""
+        if not self.dialog.winfo_exists():
+            return
+
+        # Example URLs
+        example_frame = ttk.LabelFrame(self.main_frame, text="Example", padding="5")
+        example_frame.pack(fill="x", pady=(0, 10), before=self.options_frame)
+
+        ttk.Label(
+            example_frame,
+            text="https://example.com/dashboard\nhttps://example.com/profile\nhttps://example.com/settings",
+            wraplength=460,
+            justify="left",
+        ).pack(fill="x")
@@ -1,53 +1,1041 @@
 """Authenticated web scraping with AI-assisted element detection."""
 
 import asyncio
+import atexit
+import collections
+import concurrent.futures
 import contextlib
+import functools
+import hashlib
+import html as html_lib
 import json
 import logging
 import os
 import inspect
+import queue
 import random
-from typing import Dict, Optional, List, Any, Callable, Awaitable
+import re
+import threading
+from typing import Dict, Optional, List, Any, Callable, Awaitable, Tuple
 from urllib.parse import urlparse
 
 import requests
-from bs4 import BeautifulSoup
-from playwright.async_api import async_playwright, Page, Browser
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
+from playwright.async_api import (
+    async_playwright,
+    Browser,
+    BrowserContext,
+    Page,
+    TimeoutError as PlaywrightTimeoutError,
+)
 
 from dynamic_ollama_assistant import query_ollama_chat_for_gui, DEFAULT_MODEL
+from web_scraper import clean_text
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # Fall back to BeautifulSoup
+    LexborHTMLParser = None
+
+try:
+    import lxml  # noqa: F401
+
+    _BS4_PARSER = "lxml"
+except ImportError:  # Pure-Python parser bundled with the stdlib
+    _BS4_PARSER = "html.parser"
+
+try:
+    import orjson
+except ImportError:  # Fall back to the stdlib json module
+    orjson = None
+
+try:
+    from pybloom_live import ScalableBloomFilter
+except ImportError:  # Fall back to an exact set of seen URLs
+    ScalableBloomFilter = None
+
+try:
+    import ahocorasick
+except ImportError:  # Fall back to precompiled regular expressions
+    ahocorasick = None
+
+# Number of pooled browser contexts, which also bounds concurrent page loads
+MAX_PARALLEL_PAGES = 4
+
+# Navigation timeout (ms) so slow third-party trackers cannot stall a scrape
+NAV_TIMEOUT = 15000
+
+# Bounded wait (ms) for main content to render after DOMContentLoaded
+CONTENT_WAIT_TIMEOUT = 3000
+# Single wait for any of a login field's candidate selectors to appear (ms)
+LOGIN_FIELD_TIMEOUT = 3000
+_MAIN_CONTENT_SELECTOR = "main, article, [role=main]"
+
+# Decoded documents are truncated to this many characters before parsing
+MAX_HTML_CHARS = 5_000_000
+# Responses whose Content-Length (encoded, often compressed, bytes on the wire)
+# exceeds this are skipped without being read
+MAX_TRANSFER_BYTES = 5_000_000
+
+# Shared system prompt for page analysis so every request reuses the same prefix
+_PAGE_ANALYSIS_SYSTEM_PROMPT = (
+    "You are an analytical research assistant helping a user understand web pages. "
+    "Provide clear, structured insights suitable for decision-making."
+)
+
+# Markdown sections requested for every analyzed page
+_PAGE_ANALYSIS_SECTIONS = (
+    "1. Summary (bullet list with at most 3 bullets).\n"
+    "2. Key Data Points (list important numbers, addresses, names, etc.)."
+)
+_PAGE_ANALYSIS_FOLLOWUPS = (
+    "\n3. Provide up to three follow-up research questions that would help gather "
+    "more context or confirm details."
+)
+
+# Pages analyzed per batched LLM request, and characters sent from each, so a
+# batch and its reply fit the 4096-token context the chat helper requests
+ANALYSIS_BATCH_SIZE = 4
+_BATCH_PAGE_CHARS = 2000
+
+# "PAGE <n>" heading line that opens each page's part of a batched reply,
+# allowing Markdown decoration such as "### PAGE 2" or "**PAGE 2:**"
+_BATCH_SECTION_RE = re.compile(r"^\W*PAGE\s+(\d+)\W*$", re.MULTILINE | re.IGNORECASE)
+
+# Fixed instructions for login form detection. Only the HTML travels in the user
+# message, so the model server can reuse the cached prefix across calls.
+_LOGIN_FORM_SYSTEM_PROMPT = """You are a web scraping expert. Analyze HTML and return only valid JSON with CSS selectors.
+
+Identify the login form elements in the HTML you are given. Look for username/email fields, password fields, and submit buttons.
+
+Return ONLY a JSON object with CSS selectors in this exact format:
+{"username": "css_selector_for_username", "password": "css_selector_for_password", "submit": "css_selector_for_submit_button"}
+
+Use specific selectors like input[type="email"], input[name="username"], #password, etc. If you can't find clear login elements, return {"error": "No login form detected"}."""
+
+# Common CAPTCHA and verification indicators
+_CAPTCHA_SELECTORS = (
+    # reCAPTCHA
+    'iframe[src*="recaptcha"]',
+    ".g-recaptcha",
+    "#recaptcha",
+    "[data-sitekey]",
+    # hCaptcha
+    'iframe[src*="hcaptcha"]',
+    ".h-captcha",
+    # Cloudflare
+    ".cf-challenge-running",
+    ".cf-browser-verification",
+    "#challenge-form",
+    # Generic verification
+    '[class*="captcha"]',
+    '[id*="captcha"]',
+    '[class*="verification"]',
+    '[id*="verification"]',
+    '[class*="challenge"]',
+    '[id*="challenge"]',
+)
+
+class _PhraseMatcher:
+    """Scan text for any of a fixed set of lowercase phrases in a single pass."""
+
+    def __init__(self, phrases):
+        self.phrases = tuple(phrases)
+        self._automaton = None
+        self._pattern = None
+        if ahocorasick is not None:
+            self._automaton = ahocorasick.Automaton()
+            for phrase in self.phrases:
+                self._automaton.add_word(phrase, phrase)
+            self._automaton.make_automaton()
+        else:
+            # Longest alternatives first, inside a lookahead, so one scan reports
+            # the longest phrase starting at every position, overlaps included
+            alternatives = "|".join(
+                map(re.escape, sorted(self.phrases, key=len, reverse=True))
+            )
+            self._pattern = re.compile(f"(?=({alternatives}))", re.IGNORECASE)
+            # Any other phrase starting at the same position is a prefix of it
+            self._prefixes = {
+                phrase: [
+                    other
+                    for other in self.phrases
+                    if other != phrase and phrase.startswith(other)
+                ]
+                for phrase in self.phrases
+            }
+
+    def search(self, text: str) -> bool:
+        """Return True if any phrase occurs in text, ignoring case."""
+        if self._automaton is not None:
+            return next(self._automaton.iter(text.lower()), None) is not None
+        return self._pattern.search(text) is not None
+
+    def matches(self, text: str) -> List[str]:
+        """Return every phrase found in text, in declaration order."""
+        if self._automaton is not None:
+            found = {phrase for _, phrase in self._automaton.iter(text.lower())}
+        else:
+            found = set()
+            for match in self._pattern.finditer(text):
+                phrase = match.group(1).lower()
+                found.add(phrase)
+                found.update(self._prefixes[phrase])
+        return [phrase for phrase in self.phrases if phrase in found]
+
+
+# Verification text looked for in page content (already lowercase)
+_VERIFICATION_TEXT = _PhraseMatcher(
+    (
+        "i'm not a robot",
+        "verify you are human",
+        "complete the security check",
+        "prove you're not a robot",
+        "captcha",
+        "recaptcha",
+        "hcaptcha",
+        "cloudflare",
+        "security challenge",
+        "bot detection",
+        "please verify",
+        "human verification",
+        "press & hold",
+    )
+)
+
+# Text that suggests the page is still a login form, or that login failed
+_LOGIN_INDICATORS = _PhraseMatcher(("login", "sign in", "password", "username", "email"))
+_LOGIN_FAILED = _PhraseMatcher(
+    (
+        "login failed",
+        "invalid credentials",
+        "incorrect password",
+        "authentication failed",
+        "login error",
+        "sign in",
+    )
+)
+
+# Text that suggests the site is asking for a second authentication factor
+_TWOFA_INDICATORS = _PhraseMatcher(
+    (
+        "verification code",
+        "two-factor",
+        "2fa",
+        "authenticator",
+        "security code",
+        "verify",
+        "code",
+        "authentication",
+    )
+)
+
+# Fallback selectors tried after the detected login selectors
+_USERNAME_FALLBACKS = (
+    "input[type='email']",
+    "input[name='email']",
+    "input[name='username']",
+    "input[name='user']",
+    "#email",
+    "#username",
+    "#user",
+)
+_PASSWORD_FALLBACKS = (
+    "input[type='password']",
+    "input[name='password']",
+    "input[name='pass']",
+    "#password",
+    "#pass",
+    "#passwd",
+)
+_SUBMIT_FALLBACKS = (
+    "input[type='submit']",
+    "button[type='submit']",
+)
+# Button labels (lowercase) matched when no submit selector is present
+_SUBMIT_BUTTON_TEXTS = ("login", "sign in", "log in")
+
+# Scrolls by each delta and pauses for each delay, in order
+_SCROLL_PLAN_JS = """
+async (plan) => {
+    for (const [dy, ms] of plan) {
+        if (dy) window.scrollBy(0, dy);
+        await new Promise(r => setTimeout(r, ms));
+    }
+}
+"""
+
+# Collects unique http(s) links, optionally restricted to one host
+_CRAWL_LINKS_JS = """
+({base, same}) => {
+    const out = new Set();
+    for (const a of document.querySelectorAll('a[href]')) {
+        try {
+            const u = new URL(a.href);
+            if (u.protocol !== 'http:' && u.protocol !== 'https:') continue;
+            if (same && u.host !== base) continue;
+            out.add(u.href);
+        } catch (e) {}
+    }
+    return [...out];
+}
+"""
+
+# Maps matched anchors to the first N hrefs on the page's own origin
+_SAME_ORIGIN_LINKS_JS = """
+(anchors, limit) => {
+    const origin = location.origin;
+    return anchors
+        .map(a => a.href)
+        .filter(href => href.startsWith(origin))
+        .slice(0, limit);
+}
+"""
+
+# Removes page chrome and returns the title and rendered text of the first
+# matching root (tried in order), falling back to the body
+_PAGE_TEXT_JS = """
+([selector, maxChars, roots]) => {
+    for (const el of document.querySelectorAll(selector)) el.remove();
+    let root = null;
+    for (const s of roots) {
+        root = document.querySelector(s);
+        if (root) break;
+    }
+    root = root || document.body;
+    const text = root ? root.innerText : '';
+    return {title: document.title || '', text: text.slice(0, maxChars)};
+}
+"""
+
+# Fallback main-content container, matched case-insensitively
+_CONTENT_DIV_SELECTOR = 'div[class*="content" i]'
+
+# Main content containers preferred over the whole body, in priority order
+_MAIN_CONTENT_ROOTS = ["main", "article", _CONTENT_DIV_SELECTOR]
+
+# Clicks the first visible, enabled match of the selectors, then the first such
+# button whose label matches, searching the form that holds the filled password
+# field (or the whole page when there is none)
+_CLICK_SUBMIT_JS = """
+([selectors, texts]) => {
+    const usable = (el) => {
+        const box = el.getBoundingClientRect();
+        return box.width > 0 && box.height > 0 && !el.disabled
+            && getComputedStyle(el).visibility !== "hidden";
+    };
+    const password = [...document.querySelectorAll("input[type='password']")]
+        .find(el => el.value && usable(el));
+    const scope = (password && password.form) || document;
+    for (const s of selectors) {
+        let els;
+        try { els = scope.querySelectorAll(s); } catch (e) { continue; }
+        const el = [...els].find(usable);
+        if (el) { el.click(); return s; }
+    }
+    for (const el of scope.querySelectorAll("button, [role='button']")) {
+        const label = (el.innerText || "").trim().toLowerCase();
+        if (usable(el) && texts.some(t => label.includes(t))) {
+            el.click();
+            return label;
+        }
+    }
+    return null;
+}
+"""
+
+# Resolves once none of the given 2FA phrases remain in the visible page text
+_TWOFA_CLEARED_JS = """
+(phrases) => {
+    const text = (document.body ? document.body.innerText : "").toLowerCase();
+    return !phrases.some(p => text.includes(p));
+}
+"""
+
+# Returns the first selector, in priority order, with a visible match, skipping
+# invalid ones; visible means a non-empty box without visibility:hidden
+_FIRST_VISIBLE_SELECTOR_JS = """
+(selectors) => {
+    for (const s of selectors) {
+        let els;
+        try { els = document.querySelectorAll(s); } catch (e) { continue; }
+        for (const el of els) {
+            const box = el.getBoundingClientRect();
+            if (box.width > 0 && box.height > 0
+                && getComputedStyle(el).visibility !== "hidden") return s;
+        }
+    }
+    return null;
+}
+"""
+
+# Login selectors detected by the LLM, keyed by site and a structural fingerprint
+# of the login form and persisted so repeat runs skip the model entirely
+LOGIN_SELECTOR_CACHE_FILE = "login_selector_cache.json"
+_LOGIN_SELECTOR_CACHE: Optional[Dict[str, Dict[str, str]]] = None
+# Guards the cache and its file, written from both the GUI and scraper threads
+_LOGIN_SELECTOR_CACHE_LOCK = threading.Lock()
+
+# Selectors already found per site by analyze_login_form_sync in this process
+_SITE_SELECTOR_CACHE: Dict[str, Dict[str, str]] = {}
+
+# Form controls and the attributes that identify them structurally
+_FORM_TAG_RE = re.compile(r"<(form|input|button)\b([^>]*)>", re.IGNORECASE)
+_FORM_ATTR_RE = re.compile(
+    r"""(?<![\w-])(type|name|id)\s*=\s*["']?([^"'\s>]*)""", re.IGNORECASE
+)
+
+# A stray ")" the LLM leaves after a closing quote, before "}", "," or '"'
+_JSON_FIX_RE = re.compile(r'"\s*\)\s*([},"])')
+
+# Returns the selectors that match at least one element, skipping invalid ones
+_MATCH_SELECTORS_JS = """
+(selectors) => selectors.filter(s => {
+    try { return document.querySelector(s) !== null; } catch (e) { return false; }
+})
+"""
+
+
+# Page chrome removed before extracting readable text
+_CHROME_TAGS = ("nav", "footer", "aside", "script", "style", "header")
+
+
+@functools.lru_cache(maxsize=8)
+def _tag_selector(tags: Tuple[str, ...]) -> str:
+    """Join tag names into one CSS selector so they are matched in a single pass."""
+    return ", ".join(tags)
+
+
+def _visible_only(selector: str) -> str:
+    """Restrict a CSS selector to visible matches in Playwright."""
+    return f"{selector} >> visible=true"
+
+
+# Tags kept on the first BeautifulSoup pass when main content is preferred
+_MAIN_CONTENT_STRAINER = SoupStrainer(["title", "main", "article"])
+
+
+def _extract_page_text(
+    html: str,
+    strip_tags: Tuple[str, ...] = _CHROME_TAGS,
+    prefer_main: bool = True,
+) -> Tuple[Optional[str], str]:
+    """Return the page title and cleaned text content of an HTML document."""
+    html = html[:MAX_HTML_CHARS]
+    if LexborHTMLParser is not None:
+        tree = LexborHTMLParser(html)
+        title_node = tree.css_first("title")
+        title = title_node.text(strip=True) if title_node else None
+        for node in tree.css(_tag_selector(strip_tags)):
+            node.decompose()
+        node = None
+        if prefer_main:
+            node = (
+                tree.css_first("main")
+                or tree.css_first("article")
+                or tree.css_first(_CONTENT_DIV_SELECTOR)
+            )
+        node = node or tree.root
+        text_content = node.text(separator="\n", strip=True) if node else ""
+    else:
+        node = None
+        if prefer_main:
+            # Build only the title and main/article subtrees on the first pass
+            soup = BeautifulSoup(html, _BS4_PARSER, parse_only=_MAIN_CONTENT_STRAINER)
+            node = soup.find("main") or soup.find("article")
+        if node is None:
+            soup = BeautifulSoup(html, _BS4_PARSER)
+            if prefer_main:
+                node = soup.select_one(_CONTENT_DIV_SELECTOR)
+        title_tag = soup.find("title")
+        title = title_tag.get_text().strip() if title_tag else None
+        for tag in soup.select(_tag_selector(strip_tags)):
+            tag.decompose()
+        text_content = "\n".join((node or soup).stripped_strings)
+
+    return title or None, clean_text(text_content)
+
+
+# Containers that usually hold a login form when no <form> has a password field
+_LOGIN_CONTAINER_SELECTOR = "form, [role='form'], [class*='login'], [class*='signin']"
+
+
+# Tags dropped before sampling HTML for the model, so the window holds markup
+_SNIPPET_STRIP_TAGS = ("script", "style", "noscript", "svg")
+
+
+def _login_form_snippet(html: str, limit: int = 4000) -> str:
+    """Return the HTML of the most likely login form, falling back to the page head."""
+    form_html = None
+    if LexborHTMLParser is not None:
+        tree = LexborHTMLParser(html)
+        for node in tree.css(_tag_selector(_SNIPPET_STRIP_TAGS)):
+            node.decompose()
+        node = next(
+            (
+                form
+                for form in tree.css("form")
+                if form.css_first("input[type='password']")
+            ),
+            None,
+        ) or tree.css_first(_LOGIN_CONTAINER_SELECTOR)
+        form_html = node.html if node else None
+    else:
+        soup = BeautifulSoup(html, _BS4_PARSER)
+        for tag in soup.select(_tag_selector(_SNIPPET_STRIP_TAGS)):
+            tag.decompose()
+        node = next(
+            (
+                form
+                for form in soup.find_all("form")
+                if form.find("input", attrs={"type": "password"})
+            ),
+            None,
+        ) or soup.select_one(_LOGIN_CONTAINER_SELECTOR)
+        form_html = str(node) if node else None
+
+    if form_html is None:
+        # Fall back to the start of the document with scripts and styles removed
+        form_html = tree.html if LexborHTMLParser is not None else str(soup)
+    return form_html[:limit]
+
+
+# Attribute values usable verbatim as a CSS #id selector
+_CSS_IDENT_RE = re.compile(r"^[A-Za-z_][\w-]*$")
+
+# Input types that can hold a username or email address
+_USERNAME_INPUT_TYPES = frozenset({"", "text", "email", "tel"})
+
+
+def _control_selector(tag: str, attrs: Dict[str, Any]) -> Optional[str]:
+    """Build a selector from a form control's id or name, if either is usable."""
+    if (element_id := attrs.get("id")) and _CSS_IDENT_RE.match(element_id):
+        return f"#{element_id}"
+    if (name := attrs.get("name")) and not any(c in name for c in "'\\"):
+        return f"{tag}[name='{name}']"
+    return None
+
+
+def _heuristic_login_selectors(html: str) -> Optional[Dict[str, str]]:
+    """Read selectors straight off a simple login form, or None when ambiguous.
+
+    Handles the common layout of one password field, a text or email input
+    before it and an explicit submit control, so the model is not needed.
+    """
+    if LexborHTMLParser is not None:
+        controls = [
+            (node.tag, node.attributes)
+            for node in LexborHTMLParser(html).css("input, button")
+        ]
+    else:
+        soup = BeautifulSoup(html, _BS4_PARSER)
+        controls = [(el.name, el.attrs) for el in soup.find_all(["input", "button"])]
+
+    def control_type(attrs: Dict[str, Any]) -> str:
+        return (attrs.get("type") or "").lower()
+
+    passwords = [
+        index
+        for index, (tag, attrs) in enumerate(controls)
+        if tag == "input" and control_type(attrs) == "password"
+    ]
+    if len(passwords) != 1:
+        return None
+    password_index = passwords[0]
+
+    username = next(
+        (
+            control
+            for control in reversed(controls[:password_index])
+            if control[0] == "input"
+            and control_type(control[1]) in _USERNAME_INPUT_TYPES
+        ),
+        None,
+    )
+    submits = [
+        control
+        for control in controls[password_index + 1 :]
+        if control_type(control[1]) == "submit"
+    ]
+    if username is None or len(submits) != 1:
+        return None
+
+    submit_tag, submit_attrs = submits[0]
+    selectors = {
+        "username": _control_selector(*username),
+        "password": _control_selector(*controls[password_index]),
+        "submit": _control_selector(submit_tag, submit_attrs)
+        or f"{submit_tag}[type='submit']",
+    }
+    return selectors if all(selectors.values()) else None
+
+
+# Resource types the text extraction never needs. Stylesheets stay enabled so
+# visibility checks and bounding boxes used during login remain accurate.
+_BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font", "texttrack", "manifest"})
+
+# Challenge providers whose images must still load for manual verification
+_CHALLENGE_HOSTS = ("recaptcha", "hcaptcha", "challenges.cloudflare.com", "gstatic.com")
+
+
+async def _block_heavy_resources(route, request):
+    """Abort heavy or unused resource requests except those from CAPTCHA providers."""
+    if request.resource_type in _BLOCKED_RESOURCE_TYPES and not any(
+        host in request.url for host in _CHALLENGE_HOSTS
+    ):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+def _json_loads(data):
+    """Parse JSON from str or bytes, using orjson when available."""
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def _json_dumps_pretty(obj) -> bytes:
+    """Serialize to indented JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode("utf-8")
+
+
+@functools.lru_cache(maxsize=8192)
+def _netloc(url: str) -> str:
+    """Return the network location of a URL, memoized across repeated lookups."""
+    return urlparse(url).netloc
+
+
+# <title> lookup for callers that need nothing else from the document
+_TITLE_RE = re.compile(r"<title[^>]*>(.*?)</title>", re.IGNORECASE | re.DOTALL)
+
+
+def _html_title(html: str) -> str:
+    """Return the document title from the head of the HTML without parsing it."""
+    match = _TITLE_RE.search(html, 0, 65536)
+    return html_lib.unescape(match.group(1)).strip() if match else ""
+
+
+def _exceeds_size_limit(response) -> bool:
+    """Return True if a response's Content-Length is over MAX_TRANSFER_BYTES.
+
+    The header counts transferred bytes, so compressed pages can still decode
+    past MAX_HTML_CHARS; text extraction truncates those after decoding.
+    """
+    if response is None:
+        return False
+    try:
+        return int(response.headers.get("content-length", 0)) > MAX_TRANSFER_BYTES
+    except ValueError:
+        return False
+
+
+def _form_fingerprint(html_snippet: str) -> str:
+    """Hash the type/name/id of a form's controls, ignoring volatile markup."""
+    canonical = "|".join(
+        f"{tag.lower()}:"
+        + ",".join(
+            f"{attr.lower()}={value}" for attr, value in _FORM_ATTR_RE.findall(attrs)
+        )
+        for tag, attrs in _FORM_TAG_RE.findall(html_snippet)
+    )
+    # Without any controls, fall back to the raw markup so distinct pages differ
+    return hashlib.blake2b(
+        (canonical or html_snippet).encode(), digest_size=16
+    ).hexdigest()
+
+
+def _login_selector_cache_key(site: str, html_snippet: str) -> str:
+    """Key cached selectors by site so look-alike forms on other sites miss."""
+    return f"{site}|{_form_fingerprint(html_snippet)}"
+
+
+def _login_selector_cache() -> Dict[str, Dict[str, str]]:
+    """Return the persisted login selector cache, loading it on first use."""
+    global _LOGIN_SELECTOR_CACHE
+    with _LOGIN_SELECTOR_CACHE_LOCK:
+        if _LOGIN_SELECTOR_CACHE is None:
+            _LOGIN_SELECTOR_CACHE = {}
+            if os.path.exists(LOGIN_SELECTOR_CACHE_FILE):
+                try:
+                    with open(LOGIN_SELECTOR_CACHE_FILE, "rb") as f:
+                        _LOGIN_SELECTOR_CACHE = _json_loads(f.read())
+                except (OSError, ValueError) as exc:
+                    logging.warning("Ignoring unreadable login selector cache: %s", exc)
+        return _LOGIN_SELECTOR_CACHE
+
+
+def _write_login_selector_cache(cache: Dict[str, Dict[str, str]]):
+    """Atomically rewrite the cache file; the caller holds the cache lock."""
+    try:
+        tmp_path = f"{LOGIN_SELECTOR_CACHE_FILE}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(_json_dumps_pretty(cache))
+        os.replace(tmp_path, LOGIN_SELECTOR_CACHE_FILE)
+    except OSError as exc:
+        logging.warning("Failed to persist login selector cache: %s", exc)
+
+
+def _store_login_selectors(cache_key: str, selectors: Dict[str, str]):
+    """Add selectors to the cache and atomically rewrite the cache file."""
+    cache = _login_selector_cache()
+    with _LOGIN_SELECTOR_CACHE_LOCK:
+        cache[cache_key] = dict(selectors)
+        _write_login_selector_cache(cache)
+
+
+def _forget_login_selectors(site: str):
+    """Drop every cached selector set for a site after a failed login."""
+    _SITE_SELECTOR_CACHE.pop(site, None)
+    cache = _login_selector_cache()
+    prefix = f"{site}|"
+    with _LOGIN_SELECTOR_CACHE_LOCK:
+        stale = [key for key in cache if key.startswith(prefix)]
+        if not stale:
+            return
+        for key in stale:
+            del cache[key]
+        _write_login_selector_cache(cache)
+
+
+# Chrome stripped from pages followed by crawl_with_login
+_CRAWL_STRIP_TAGS = ("nav", "footer", "aside", "script", "style")
+
+# A plain HTTP fetch with less readable text than this is assumed to be a
+# script-rendered shell and is loaded in the browser instead
+_STATIC_MIN_TEXT_CHARS = 200
+
+
+async def _fetch_static_page_text(
+    page: Page, url: str
+) -> Optional[Tuple[Optional[str], str]]:
+    """Fetch url without rendering, returning its title and text if it is static HTML.
+
+    The request goes through the page's browser context, so it carries the same
+    cookies as a navigation. None means the page should be rendered instead.
+    """
+    try:
+        response = await page.context.request.get(url, timeout=NAV_TIMEOUT)
+    except Exception as e:
+        logging.debug(f"Plain fetch of {url} failed, rendering instead: {e}")
+        return None
+    try:
+        headers = response.headers
+        if not response.ok or "text/html" not in headers.get("content-type", ""):
+            return None
+        if _exceeds_size_limit(response):
+            return None
+        title, text = _extract_page_text(
+            await response.text(), strip_tags=_CRAWL_STRIP_TAGS, prefer_main=False
+        )
+    except Exception as e:
+        logging.debug(f"Could not read plain fetch of {url}, rendering instead: {e}")
+        return None
+    finally:
+        await response.dispose()
+    if len(text) < _STATIC_MIN_TEXT_CHARS:
+        return None
+    return title, text
+
+
+def _balanced_objects(text: str):
+    """Yield each balanced {...} span in text with one linear, string-aware scan."""
+    start = text.find("{")
+    while start != -1:
+        depth = 0
+        in_string = False
+        escaped = False
+        for i in range(start, len(text)):
+            ch = text[i]
+            if in_string:
+                if escaped:
+                    escaped = False
+                elif ch == "\\":
+                    escaped = True
+                elif ch == '"':
+                    in_string = False
+            elif ch == '"':
+                in_string = True
+            elif ch == "{":
+                depth += 1
+            elif ch == "}":
+                depth -= 1
+                if depth == 0:
+                    yield text[start : i + 1]
+                    break
+        start = text.find("{", start + 1)
+
+
+def _read_until_json_object(stream) -> str:
+    """Consume a text stream up to the end of its first complete JSON object.
+
+    Brace depth is tracked across chunks so each character is scanned once, and
+    the stream is closed as soon as the object ends, cutting off trailing prose.
+    """
+    chunks = []
+    depth = 0
+    in_string = False
+    escaped = False
+    try:
+        for chunk in stream:
+            chunks.append(chunk)
+            for ch in chunk:
+                if in_string:
+                    if escaped:
+                        escaped = False
+                    elif ch == "\\":
+                        escaped = True
+                    elif ch == '"':
+                        in_string = False
+                elif ch == "{":
+                    depth += 1
+                elif depth and ch == '"':
+                    in_string = True
+                elif depth and ch == "}":
+                    depth -= 1
+                    if depth == 0 and _find_json_object("".join(chunks)):
+                        return "".join(chunks)
+    finally:
+        stream.close()
+    return "".join(chunks)
+
+
+def _find_json_object(text: str) -> Optional[str]:
+    """Return the first balanced, parseable JSON object in text, if any."""
+    for candidate in _balanced_objects(text):
+        try:
+            _json_loads(candidate)
+            return candidate
+        except json.JSONDecodeError:
+            continue
+    return None
+
+
+async def _launch_browser(playwright, remote_endpoint: Optional[str]) -> Browser:
+    """Connect to the remote browser if configured, otherwise launch Chromium."""
+    if remote_endpoint:
+        try:
+            return await playwright.chromium.connect_over_cdp(remote_endpoint)
+        except Exception as exc:
+            logging.error("Failed to connect to remote browser at %s: %s", remote_endpoint, exc)
+            raise
+    return await playwright.chromium.launch(headless=False)
+
+
+# Seconds the shared browser stays open without users before it is closed
+SHARED_BROWSER_IDLE_TIMEOUT = 300
+
+# Browser shared by the synchronous wrappers, launched once and kept open between
+# calls until it has been idle for SHARED_BROWSER_IDLE_TIMEOUT
+_SHARED_PLAYWRIGHT_CM = None
+_SHARED_BROWSER: Optional[Browser] = None
+_SHARED_ENDPOINT: Optional[str] = None
+_SHARED_USERS = 0
+_SHARED_BROWSER_LOCK: Optional[asyncio.Lock] = None
+_SHARED_IDLE_HANDLE: Optional[asyncio.TimerHandle] = None
+
+
+async def _acquire_shared_browser(remote_endpoint: Optional[str]) -> Optional[Browser]:
+    """Borrow the process-wide browser, launching it when none is open.
+
+    Returns ``None`` when the browser is busy with another endpoint or has
+    disconnected under its current users, so the caller launches its own.
+    """
+    global _SHARED_PLAYWRIGHT_CM, _SHARED_BROWSER, _SHARED_ENDPOINT, _SHARED_USERS
+    global _SHARED_BROWSER_LOCK, _SHARED_IDLE_HANDLE
+    if _SHARED_BROWSER_LOCK is None:
+        _SHARED_BROWSER_LOCK = asyncio.Lock()
+
+    async with _SHARED_BROWSER_LOCK:
+        if _SHARED_IDLE_HANDLE is not None:
+            _SHARED_IDLE_HANDLE.cancel()
+            _SHARED_IDLE_HANDLE = None
+
+        reusable = (
+            _SHARED_BROWSER is not None
+            and _SHARED_BROWSER.is_connected()
+            and _SHARED_ENDPOINT == remote_endpoint
+        )
+        if reusable:
+            _SHARED_USERS += 1
+            return _SHARED_BROWSER
+        if _SHARED_USERS:
+            return None
+
+        # The idle browser was closed by the user or targets another endpoint
+        await _close_shared_browser()
+        _SHARED_PLAYWRIGHT_CM = async_playwright()
+        playwright = await _SHARED_PLAYWRIGHT_CM.__aenter__()
+        try:
+            _SHARED_BROWSER = await _launch_browser(playwright, remote_endpoint)
+        except BaseException:
+            await _close_shared_browser()
+            raise
+        _SHARED_ENDPOINT = remote_endpoint
+        _SHARED_USERS = 1
+        return _SHARED_BROWSER
+
+
+async def _release_shared_browser():
+    """Drop one user of the shared browser, starting the idle timer at zero."""
+    global _SHARED_USERS, _SHARED_IDLE_HANDLE
+    async with _SHARED_BROWSER_LOCK:
+        _SHARED_USERS -= 1
+        if not _SHARED_USERS:
+            _SHARED_IDLE_HANDLE = asyncio.get_running_loop().call_later(
+                SHARED_BROWSER_IDLE_TIMEOUT,
+                lambda: asyncio.ensure_future(_close_idle_shared_browser()),
+            )
+
+
+async def _close_idle_shared_browser():
+    """Close the shared browser if nobody borrowed it since the idle timer started."""
+    global _SHARED_IDLE_HANDLE
+    async with _SHARED_BROWSER_LOCK:
+        _SHARED_IDLE_HANDLE = None
+        if not _SHARED_USERS:
+            await _close_shared_browser()
+
+
+async def _close_shared_browser():
+    """Close the shared browser and stop its Playwright driver."""
+    global _SHARED_PLAYWRIGHT_CM, _SHARED_BROWSER, _SHARED_ENDPOINT, _SHARED_USERS
+    if _SHARED_BROWSER is not None and not _SHARED_ENDPOINT:
+        with contextlib.suppress(Exception):
+            await _SHARED_BROWSER.close()
+    if _SHARED_PLAYWRIGHT_CM is not None:
+        with contextlib.suppress(Exception):
+            await _SHARED_PLAYWRIGHT_CM.__aexit__(None, None, None)
+    _SHARED_PLAYWRIGHT_CM = None
+    _SHARED_BROWSER = None
+    _SHARED_ENDPOINT = None
+    _SHARED_USERS = 0
+
+
+def _query_analysis_model(user_msg: str, label: str) -> Optional[str]:
+    """Run one page-analysis chat request, returning the full reply or None."""
+    try:
+        chunks: List[str] = []
+        for chunk in query_ollama_chat_for_gui(
+            model=DEFAULT_MODEL,
+            system_prompt=_PAGE_ANALYSIS_SYSTEM_PROMPT,
+            user_msg=user_msg,
+        ):
+            chunks.append(chunk)
+        return "".join(chunks).strip()
+    except Exception as exc:  # noqa: BLE001
+        logging.warning("Failed to generate page analysis for %s: %s", label, exc)
+        return None
+
+
+def _analysis_entry(analysis_text: str, include_followups: bool) -> Dict[str, Any]:
+    """Package an analysis reply, pulling out up to three follow-up bullets."""
+    followups: List[str] = []
+    if include_followups:
+        for line in analysis_text.splitlines():
+            stripped = line.strip()
+            if stripped.startswith("-"):
+                followups.append(stripped.lstrip("-•* "))
+        followups = followups[:3]
+
+    return {"analysis": analysis_text, "followups": followups}
+
+
+def _split_batch_reply(reply: str) -> Dict[int, str]:
+    """Split a batched analysis reply into its non-empty sections by page number."""
+    sections: Dict[int, str] = {}
+    headings = list(_BATCH_SECTION_RE.finditer(reply))
+    for heading, following in zip(headings, [*headings[1:], None]):
+        end = following.start() if following else len(reply)
+        if body := reply[heading.end() : end].strip():
+            sections.setdefault(int(heading.group(1)), body)
+    return sections
 
 
 class AuthenticatedScraper:
     """Handle authenticated web scraping with session management."""
 
-    def __init__(self):
+    def __init__(self, reuse_browser: bool = False):
         self.browser: Optional[Browser] = None
+        # Borrow the process-wide browser instead of launching one per scraper
+        self.reuse_browser = reuse_browser
         self.sessions_file = "scraper_sessions.json"
         self.playwright_cm = None
         self.playwright = None
         self.remote_endpoint = os.getenv("PLAYWRIGHT_REMOTE_ENDPOINT")
+        self._context_pool: Optional[asyncio.Queue] = None
+        self._contexts: List[BrowserContext] = []
+        self._sessions_cache: Optional[Dict[str, Any]] = None
+        # (context id, domain) pairs whose saved cookies are already loaded
+        self._restored_sessions: set = set()
+        # Serializes session writes, which share one temp file
+        self._session_lock: Optional[asyncio.Lock] = None
 
     async def __aenter__(self):
         """Async context manager entry."""
-        self.playwright_cm = async_playwright()
-        self.playwright = await self.playwright_cm.__aenter__()
-        if self.remote_endpoint:
-            try:
-                self.browser = await self.playwright.chromium.connect_over_cdp(self.remote_endpoint)
-            except Exception as exc:
-                logging.error("Failed to connect to remote browser at %s: %s", self.remote_endpoint, exc)
-                raise
-        else:
-            self.browser = await self.playwright.chromium.launch(headless=False)
+        if self.reuse_browser:
+            self.browser = await _acquire_shared_browser(self.remote_endpoint)
+            # Launch a private browser when the shared one is tied up elsewhere
+            self.reuse_browser = self.browser is not None
+        if not self.reuse_browser:
+            self.playwright_cm = async_playwright()
+            self.playwright = await self.playwright_cm.__aenter__()
+            self.browser = await _launch_browser(self.playwright, self.remote_endpoint)
+
+        # Pre-warm a pool of isolated contexts shared by all scraping methods
+        self._context_pool = asyncio.Queue()
+        try:
+            for _ in range(MAX_PARALLEL_PAGES):
+                context = await self.browser.new_context()
+                await context.route("**/*", _block_heavy_resources)
+                self._contexts.append(context)
+                self._context_pool.put_nowait(context)
+        except BaseException:
+            # Give back the shared browser, or close our own, before failing
+            await self.__aexit__(None, None, None)
+            raise
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
+        for context in self._contexts:
+            with contextlib.suppress(Exception):
+                await context.close()
+        self._contexts.clear()
+        self._restored_sessions.clear()
+        self._context_pool = None
+        if self.reuse_browser:
+            await _release_shared_browser()
+            return
         if self.browser and not self.remote_endpoint:
             await self.browser.close()
         if self.playwright_cm:
             await self.playwright_cm.__aexit__(exc_type, exc_val, exc_tb)
 
+    async def _acquire_context(self) -> BrowserContext:
+        """Take a browser context from the pool, waiting if all are in use."""
+        return await self._context_pool.get()
+
+    def _release_context(self, context: BrowserContext):
+        """Return a browser context to the pool."""
+        self._context_pool.put_nowait(context)
+
+    @contextlib.asynccontextmanager
+    async def _pooled_page(self):
+        """Open a page in a pooled context, closing it and releasing the context after use."""
+        context = await self._acquire_context()
+        try:
+            page = await context.new_page()
+            try:
+                yield page
+            finally:
+                with contextlib.suppress(Exception):
+                    await page.close()
+        finally:
+            self._release_context(context)
+
     def set_remote_endpoint(self, endpoint: Optional[str]):
         """Update the remote debugging endpoint."""
         self.remote_endpoint = endpoint
@@ -71,82 +1059,128 @@ class AuthenticatedScraper:
             return None
 
         truncated = clean_content[:4000]
-        system_prompt = (
-            "You are an analytical research assistant helping a user understand web pages. "
-            "Provide clear, structured insights suitable for decision-making."
-        )
 
-        followup_instructions = (
-            "\n3. Provide up to three follow-up research questions that would help gather "
-            "more context or confirm details."
-            if include_followups
-            else ""
-        )
+        followup_instructions = _PAGE_ANALYSIS_FOLLOWUPS if include_followups else ""
 
         user_msg = (
             f"URL: {url}\n\n"
             "Analyze the following page content. Respond in Markdown with the sections:\n"
-            "1. Summary (bullet list with at most 3 bullets).\n"
-            "2. Key Data Points (list important numbers, addresses, names, etc.)."
-            f"{followup_instructions}\n\n"
+            f"{_PAGE_ANALYSIS_SECTIONS}{followup_instructions}\n\n"
             "CONTENT:\n"
             f"{truncated}"
         )
 
-        def _run_model() -> Optional[str]:
-            try:
-                chunks: List[str] = []
-                for chunk in query_ollama_chat_for_gui(
-                    model=DEFAULT_MODEL,
-                    system_prompt=system_prompt,
-                    user_msg=user_msg,
-                ):
-                    chunks.append(chunk)
-                return "".join(chunks).strip()
-            except Exception as exc:  # noqa: BLE001
-                logging.warning("Failed to generate page analysis for %s: %s", url, exc)
-                return None
-
-        analysis_text = await asyncio.to_thread(_run_model)
+        analysis_text = await asyncio.to_thread(_query_analysis_model, user_msg, url)
         if not analysis_text:
             return None
+        return _analysis_entry(analysis_text, include_followups)
 
-        followups: List[str] = []
-        if include_followups:
-            for line in analysis_text.splitlines():
-                stripped = line.strip()
-                if stripped.startswith("-"):
-                    followups.append(stripped.lstrip("-•* "))
-            followups = followups[:3]
+    async def _generate_page_analyses_batch(
+        self,
+        items: List[Tuple[str, str]],
+        include_followups: bool = False,
+    ) -> List[Optional[Dict[str, Any]]]:
+        """Analyze (url, clean_content) pairs, several pages per LLM request.
+
+        Pages are stacked into one prompt per ANALYSIS_BATCH_SIZE pages behind the
+        shared system prompt. Any page the model leaves out of its reply is then
+        analyzed on its own. Results keep the order of ``items``.
+        """
+        analyses: List[Optional[Dict[str, Any]]] = [None] * len(items)
+        pending = [i for i, (_, content) in enumerate(items) if content.strip()]
+        followup_instructions = _PAGE_ANALYSIS_FOLLOWUPS if include_followups else ""
+
+        async def _analyze_batch(batch: List[int]):
+            pages = "\n\n".join(
+                f"PAGE {number}\nURL: {items[i][0]}\n"
+                f"CONTENT:\n{items[i][1][:_BATCH_PAGE_CHARS]}"
+                for number, i in enumerate(batch, 1)
+            )
+            user_msg = (
+                f"Analyze each of the {len(batch)} pages below separately. Begin "
+                "each page's answer with a line reading 'PAGE <number>', then "
+                "respond in Markdown with the sections:\n"
+                f"{_PAGE_ANALYSIS_SECTIONS}{followup_instructions}\n\n"
+                f"{pages}"
+            )
+            reply = await asyncio.to_thread(
+                _query_analysis_model, user_msg, f"{len(batch)} pages"
+            )
+            sections = _split_batch_reply(reply or "")
+            for number, i in enumerate(batch, 1):
+                if section := sections.get(number):
+                    analyses[i] = _analysis_entry(section, include_followups)
+
+        batches = [
+            pending[start : start + ANALYSIS_BATCH_SIZE]
+            for start in range(0, len(pending), ANALYSIS_BATCH_SIZE)
+        ]
+        await asyncio.gather(
+            *(_analyze_batch(batch) for batch in batches if len(batch) > 1)
+        )
 
-        return {"analysis": analysis_text, "followups": followups}
+        # Single pages, and pages missing from a batched reply, get their own request
+        missing = [i for i in pending if analyses[i] is None]
+        for i, analysis_info in zip(
+            missing,
+            await asyncio.gather(
+                *(
+                    self._generate_page_analysis(*items[i], include_followups)
+                    for i in missing
+                )
+            ),
+        ):
+            analyses[i] = analysis_info
+        return analyses
+
+    async def _attach_page_analyses(self, results: List[Dict[str, Any]]):
+        """Add batched LLM analyses to every successfully scraped result."""
+        scraped = [
+            result
+            for result in results
+            if not any(
+                marker in result["name"] for marker in ("Error", "Failed", "Skipped")
+            )
+        ]
+        analyses = await self._generate_page_analyses_batch(
+            [(result["url"], result["content"]) for result in scraped]
+        )
+        for result, analysis_info in zip(scraped, analyses):
+            if analysis_info:
+                result["analysis"] = analysis_info.get("analysis")
+                result["followups"] = analysis_info.get("followups", [])
 
-    def analyze_login_form(self, html_content: str) -> Dict[str, str]:
-        """Use AI to identify login form elements."""
-        # Truncate HTML to avoid token limits
-        html_snippet = html_content[:8000]
+    @staticmethod
+    def analyze_login_form(
+        html_content: str, site: str = "", use_cache: bool = True
+    ) -> Dict[str, str]:
+        """Use AI to identify login form elements on the page from ``site``.
 
-        prompt = f"""Analyze this HTML and identify login form elements. Look for username/email fields, password fields, and submit buttons.
+        Pass ``use_cache=False`` to ignore cached selectors; the fresh result
+        still replaces the cached entry.
+        """
+        # Send only the login form region to keep the prompt short
+        html_snippet = _login_form_snippet(html_content)
 
-HTML:
-{html_snippet}
+        cache_key = _login_selector_cache_key(site, html_snippet)
+        if use_cache and (cached := _login_selector_cache().get(cache_key)):
+            return dict(cached)
 
-Return ONLY a JSON object with CSS selectors in this exact format:
-{{"username": "css_selector_for_username", "password": "css_selector_for_password", "submit": "css_selector_for_submit_button"}}
-
-Use specific selectors like input[type="email"], input[name="username"], #password, etc. If you can't find clear login elements, return {{"error": "No login form detected"}}.
-"""
+        # Simple forms can be read directly without asking the model
+        if selectors := _heuristic_login_selectors(html_snippet):
+            logging.info("Login form detected without AI analysis")
+            return selectors
 
         try:
             try:
-                response = "".join(
-                    query_ollama_chat_for_gui(
-                        model=DEFAULT_MODEL,
-                        system_prompt="You are a web scraping expert. Analyze HTML and return only valid JSON with CSS selectors.",
-                        user_msg=prompt,
-                        conversation_history=[],
-                    )
+                stream = query_ollama_chat_for_gui(
+                    model=DEFAULT_MODEL,
+                    system_prompt=_LOGIN_FORM_SYSTEM_PROMPT,
+                    user_msg=f"HTML:\n{html_snippet}",
+                    conversation_history=[],
                 )
+                # Stop generating as soon as a complete JSON object has streamed in
+                response = _read_until_json_object(stream)
             except Exception as e:
                 logging.error(f"Failed to query Ollama API: {e}")
                 return {"error": f"AI service unavailable: {str(e)}"}
@@ -168,22 +1202,23 @@ Use specific selectors like input[type="email"], input[name="username"], #passwo
             # Try to find JSON object in the response
             response = response.strip()
 
-            # Look for JSON object pattern
-            import re
-
-            if json_match := re.search(r"\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}", response):
-                response = json_match.group()
+            # Prefer the first object that parses, else the first balanced span
+            if json_text := _find_json_object(response):
+                response = json_text
+            else:
+                response = next(_balanced_objects(response), response)
 
-            # Clean up common JSON syntax errors
-            response = re.sub(r'"\s*\)\s*}', '"}', response)  # Fix ")}" -> "}"
-            response = re.sub(r'"\s*\)\s*,', '",', response)  # Fix ")," -> ","
-            response = re.sub(r'"\s*\)\s*"', '""', response)  # Fix ")" -> ""
+                # Clean up common JSON syntax errors: ")}" -> "}", ")," -> ","
+                # and ")" -> "", tolerating whitespace around the parenthesis
+                response = _JSON_FIX_RE.sub(r'"\1', response)
 
             # Parse JSON
-            selectors = json.loads(response)
+            selectors = _json_loads(response)
 
             # Validate the response format
             if isinstance(selectors, dict):
+                if "error" not in selectors:
+                    _store_login_selectors(cache_key, selectors)
                 return selectors
             else:
                 return {"error": "Invalid response format from AI"}
@@ -196,72 +1231,29 @@ Use specific selectors like input[type="email"], input[name="username"], #passwo
             logging.error(f"Failed to analyze login form: {e}")
             return {"error": f"Analysis failed: {str(e)}"}
 
-    async def detect_captcha_or_verification(self, page: Page) -> Dict[str, str]:
-        """Detect if page contains CAPTCHA or human verification challenges."""
-        try:
-            # Common CAPTCHA and verification indicators
-            captcha_selectors = [
-                # reCAPTCHA
-                'iframe[src*="recaptcha"]',
-                ".g-recaptcha",
-                "#recaptcha",
-                "[data-sitekey]",
-                # hCaptcha
-                'iframe[src*="hcaptcha"]',
-                ".h-captcha",
-                # Cloudflare
-                ".cf-challenge-running",
-                ".cf-browser-verification",
-                "#challenge-form",
-                # Generic verification
-                '[class*="captcha"]',
-                '[id*="captcha"]',
-                '[class*="verification"]',
-                '[id*="verification"]',
-                '[class*="challenge"]',
-                '[id*="challenge"]',
-            ]
-
-            verification_found = []
+    async def detect_captcha_or_verification(
+        self, page: Page, content: Optional[str] = None
+    ) -> Dict[str, str]:
+        """Detect if page contains CAPTCHA or human verification challenges.
 
-            for selector in captcha_selectors:
-                try:
-                    elements = await page.query_selector_all(selector)
-                    if elements:
-                        verification_found.append(selector)
-                except Exception:
-                    continue
+        Pass ``content`` to reuse an HTML snapshot the caller already has.
+        """
+        try:
+            # Probe every selector in one round-trip to the browser
+            verification_found = await page.evaluate(
+                _MATCH_SELECTORS_JS, list(_CAPTCHA_SELECTORS)
+            )
 
             # Check page content for verification text
-            page_content = await page.content()
-            verification_phrases = [
-                "i'm not a robot",
-                "verify you are human",
-                "complete the security check",
-                "prove you're not a robot",
-                "captcha",
-                "recaptcha",
-                "hcaptcha",
-                "cloudflare",
-                "security challenge",
-                "bot detection",
-                "please verify",
-                "human verification",
-                "press & hold",
-            ]
-
-            content_matches = [
-                phrase
-                for phrase in verification_phrases
-                if phrase.lower() in page_content.lower()
-            ]
+            page_content = content if content is not None else await page.content()
+            content_matches = _VERIFICATION_TEXT.matches(page_content)
 
             if verification_found or content_matches:
                 return {
                     "verification_detected": True,
                     "selectors_found": verification_found,
                     "content_matches": content_matches,
-                    "page_title": await page.title(),
+                    "page_title": _html_title(page_content),
                     "current_url": page.url,
                 }
 
@@ -280,39 +1272,60 @@ Use specific selectors like input[type="email"], input[name="username"], #passwo
         save_session: bool = True,
     ) -> Dict[str, str]:
         """Scrape content from a site requiring authentication."""
+        result = await self._scrape_with_login(
+            url, username, password, login_selectors, save_session
+        )
+        if result["name"].startswith(("Login Error", "Login Failed")):
+            # Cached selectors that did not log in must not be reused
+            _forget_login_selectors(_netloc(url))
+        return result
 
+    async def _scrape_with_login(
+        self,
+        url: str,
+        username: str,
+        password: str,
+        login_selectors: Optional[Dict[str, str]],
+        save_session: bool,
+    ) -> Dict[str, str]:
+        """Log in, then scrape the landing page; see ``scrape_with_login``."""
         if not self.browser:
             raise RuntimeError("Browser not initialized. Use async context manager.")
 
-        page = await self.browser.new_page()
-
-        try:
+        netloc = _netloc(url)
+        async with self._pooled_page() as page:
             # Navigate to the site
-            await page.goto(url, wait_until="networkidle")
+            await page.goto(url, wait_until="domcontentloaded", timeout=NAV_TIMEOUT)
+
+            # Snapshot the DOM once and reuse it until the page changes
+            page_content = await page.content()
 
             # Check for CAPTCHA or human verification challenges
-            verification_check = await self.detect_captcha_or_verification(page)
+            verification_check = await self.detect_captcha_or_verification(
+                page, page_content
+            )
             if verification_check.get("verification_detected"):
                 handled = await self._handle_press_and_hold_challenge(page)
                 if not handled:
                     return {
-                        "name": f"Verification Required: {urlparse(url).netloc}",
+                        "name": f"Verification Required: {netloc}",
                         "content": f"Human verification detected on {url}. Manual intervention required.",
                         "url": url,
                         "verification_info": verification_check,
                         "requires_manual_verification": True,
                     }
             else:
-                await self._handle_press_and_hold_challenge(page)
+                handled = await self._handle_press_and_hold_challenge(page)
+            if handled:
+                page_content = await page.content()
 
             # If no selectors provided, try to detect them
             if not login_selectors:
-                html_content = await page.content()
-                login_selectors = self.analyze_login_form(html_content)
+                login_selectors = self.analyze_login_form(page_content, netloc)
 
                 if "error" in login_selectors:
                     return {
-                        "name": f"Error: {urlparse(url).netloc}",
+                        "name": f"Error: {netloc}",
                         "content": f"Failed to detect login form: {login_selectors['error']}",
                         "url": url,
                     }
@@ -320,56 +1333,23 @@ Use specific selectors like input[type="email"], input[name="username"], #passwo
             # Attempt login
             try:
                 # Fill username with fallback options
-                username_filled = False
-                username_selectors = [
-                    login_selectors["username"],
-                    "input[type='email']",
-                    "input[name='email']",
-                    "input[name='username']",
-                    "input[name='user']",
-                    "#email",
-                    "#username",
-                    "#user",
-                ]
-
-                for selector in username_selectors:
-                    try:
-                        await page.fill(selector, username, timeout=3000)
-                        username_filled = True
-                        break
-                    except Exception:
-                        continue
-
-                if not username_filled:
+                username_selectors = (login_selectors["username"], *_USERNAME_FALLBACKS)
+                if not await self._fill_login_field(
+                    page, username_selectors, username
+                ):
                     return {
-                        "name": f"Login Error: {urlparse(url).netloc}",
+                        "name": f"Login Error: {netloc}",
                         "content": f"Could not find username field. Tried: {', '.join(username_selectors[:3])}",
                         "url": url,
                     }
 
                 # Fill password with fallback options
-                password_filled = False
-                password_selectors = [
-                    login_selectors["password"],
-                    "input[type='password']",
-                    "input[name='password']",
-                    "input[name='pass']",
-                    "#password",
-                    "#pass",
-                    "#passwd",
-                ]
-
-                for selector in password_selectors:
-                    try:
-                        await page.fill(selector, password, timeout=3000)
-                        password_filled = True
-                        break
-                    except Exception:
-                        continue
-
-                if not password_filled:
+                password_selectors = (login_selectors["password"], *_PASSWORD_FALLBACKS)
+                if not await self._fill_login_field(
+                    page, password_selectors, password
+                ):
                     return {
-                        "name": f"Login Error: {urlparse(url).netloc}",
+                        "name": f"Login Error: {netloc}",
                         "content": f"Could not find password field. Tried: {', '.join(password_selectors[:3])}",
                         "url": url,
                     }
@@ -379,21 +1359,25 @@ Use specific selectors like input[type="email"], input[name="username"], #passwo
                 if submit_result:  # If there was an error
                     return submit_result
 
-                # Wait for navigation or content change
-                await page.wait_for_load_state("networkidle", timeout=15000)
+                # Wait for the post-submit document to parse, not for every subresource
+                with contextlib.suppress(PlaywrightTimeoutError):
+                    await page.wait_for_load_state(
+                        "domcontentloaded", timeout=NAV_TIMEOUT
+                    )
+                    await page.wait_for_selector(
+                        "body", state="attached", timeout=CONTENT_WAIT_TIMEOUT
+                    )
 
-                # Check for 2FA prompt
-                await self._handle_2fa_if_present(page)
+                # Check for 2FA prompt, refreshing the snapshot if it was shown
+                page_content = await page.content()
+                if await self._handle_2fa_if_present(page, page_content):
+                    page_content = await page.content()
 
                 # After 2FA, check if we're already logged in
                 current_url = page.url
-                page_content = await page.content()
 
                 # If URL changed significantly or we don't see login indicators, we're likely logged in
-                login_indicators = ["login", "sign in", "password", "username", "email"]
-                if current_url != url and not any(
-                    indicator in page_content.lower() for indicator in login_indicators
-                ):
+                if current_url != url and not _LOGIN_INDICATORS.search(page_content):
                     logging.info(
                         "Already authenticated after 2FA - skipping submit button"
                     )
@@ -401,34 +1385,22 @@ Use specific selectors like input[type="email"], input[name="username"], #passwo
                 else:
                     # Only try submit button if we're still on a login page
                     await self._try_submit_button(page, login_selectors)
+                    page_content = await page.content()
 
             except Exception as e:
                 return {
-                    "name": f"Login Error: {urlparse(url).netloc}",
+                    "name": f"Login Error: {netloc}",
                     "content": f"Login failed: {str(e)}",
                     "url": url,
                 }
 
             # Check if login was successful (look for common indicators)
             current_url = page.url
-            page_content = await page.content()
 
             # Simple heuristics for login success
-            login_failed_indicators = [
-                "login failed",
-                "invalid credentials",
-                "incorrect password",
-                "authentication failed",
-                "login error",
-                "sign in",
-            ]
-
-            if any(
-                indicator in page_content.lower()
-                for indicator in login_failed_indicators
-            ):
+            if _LOGIN_FAILED.search(page_content):
                 return {
-                    "name": f"Login Failed: {urlparse(url).netloc}",
+                    "name": f"Login Failed: {netloc}",
                     "content": "Login appears to have failed based on page content.",
                     "url": url,
                 }
@@ -438,27 +1410,8 @@ Use specific selectors like input[type="email"], input[name="username"], #passwo
                 await self._save_session(page, url)
 
             # Extract content
-            soup = BeautifulSoup(page_content, "html.parser")
-
-            # Remove unwanted elements
-            for tag in soup(["nav", "footer", "aside", "script", "style", "header"]):
-                tag.decompose()
-
-            if main_content := (
-                soup.find("main")
-                or soup.find("article")
-                or soup.find("div", class_=lambda x: x and "content" in x.lower())
-            ):
-                text_content = main_content.get_text(separator="\n", strip=True)
-            else:
-                text_content = soup.get_text(separator="\n", strip=True)
-
-            # Clean up text
-            lines = [line.strip() for line in text_content.split("\n") if line.strip()]
-            clean_content = "\n".join(lines)
-
-            title = soup.find("title")
-            page_title = title.get_text().strip() if title else urlparse(url).netloc
+            title, clean_content = _extract_page_text(page_content)
+            page_title = title or netloc
 
             return {
                 "name": f"Authenticated: {page_title}",
@@ -466,8 +1419,6 @@ Use specific selectors like input[type="email"], input[name="username"], #passwo
                 "url": current_url,
             }
 
-        finally:
-            await page.close()
 
     async def crawl_with_login(
         self,
@@ -476,8 +1427,13 @@ Use specific selectors like input[type="email"], input[name="username"], #passwo
         password: str,
         max_pages: int = 3,
         login_selectors: Optional[Dict[str, str]] = None,
+        include_ai_summary: bool = False,
     ) -> List[Dict[str, str]]:
-        """Crawl multiple pages after authentication."""
+        """Crawl multiple pages after authentication.
+
+        With ``include_ai_summary``, every page is analyzed once the crawl has
+        collected them all, several pages per LLM request.
+        """
 
         results = []
 
@@ -495,162 +1451,177 @@ Use specific selectors like input[type="email"], input[name="username"], #passwo
             return results
 
         # Try to find more links to crawl
-        page = await self.browser.new_page()
-
-        try:
+        async with self._pooled_page() as page:
             # Restore session and navigate
             await self._restore_session(page, base_url)
-            await page.goto(base_url, wait_until="networkidle")
-
-            # Find internal links
-            links = await page.evaluate(
-                """
-                () => {
-                    const links = Array.from(document.querySelectorAll('a[href]'));
-                    return links
-                        .map(link => link.href)
-                        .filter(href => href.startsWith(window.location.origin))
-                        .slice(0, 10); // Limit to first 10 links
-                }
-            """
+            await page.goto(
+                base_url, wait_until="domcontentloaded", timeout=NAV_TIMEOUT
             )
 
-            base_domain = urlparse(base_url).netloc
-            visited_urls = {base_url}
+            # Find internal links, limited to the first 10
+            links = await page.eval_on_selector_all(
+                "a[href]", _SAME_ORIGIN_LINKS_JS, 10
+            )
 
-            for link in links[: max_pages - 1]:
-                if link in visited_urls:
-                    continue
+        base_domain = _netloc(base_url)
+        visited_urls = {base_url}
+        pending_links = []
 
-                visited_urls.add(link)
+        for link in links[: max_pages - 1]:
+            if link in visited_urls:
+                continue
+            visited_urls.add(link)
+            pending_links.append(link)
 
+        async def _scrape_one(link: str) -> Optional[Dict[str, str]]:
+            async with self._pooled_page() as link_page:
                 try:
-                    await page.goto(link, wait_until="networkidle")
-                    content = await page.content()
-
-                    soup = BeautifulSoup(content, "html.parser")
-
-                    # Clean content
-                    for tag in soup(["nav", "footer", "aside", "script", "style"]):
-                        tag.decompose()
-
-                    text_content = soup.get_text(separator="\n", strip=True)
-                    lines = [
-                        line.strip()
-                        for line in text_content.split("\n")
-                        if line.strip()
-                    ]
-                    clean_content = "\n".join(lines)
-
-                    title = soup.find("title")
-                    page_title = (
-                        title.get_text().strip()
-                        if title
-                        else f"Page from {base_domain}"
-                    )
+                    await self._restore_session(link_page, link)
+
+                    # Static pages are fetched over plain HTTP with the session
+                    # cookies; only script-rendered pages need a navigation
+                    extracted = await _fetch_static_page_text(link_page, link)
+                    if extracted is None:
+                        response = await link_page.goto(
+                            link, wait_until="domcontentloaded", timeout=NAV_TIMEOUT
+                        )
+                        if _exceeds_size_limit(response):
+                            logging.warning(f"Skipping oversized page {link}")
+                            return None
+                        extracted = _extract_page_text(
+                            await link_page.content(),
+                            strip_tags=_CRAWL_STRIP_TAGS,
+                            prefer_main=False,
+                        )
+                    title, clean_content = extracted
+                    page_title = title or f"Page from {base_domain}"
 
-                    results.append(
-                        {
-                            "name": f"Authenticated: {page_title}",
-                            "content": clean_content,
-                            "url": link,
-                        }
-                    )
+                    return {
+                        "name": f"Authenticated: {page_title}",
+                        "content": clean_content,
+                        "url": link,
+                    }
 
                 except Exception as e:
                     logging.warning(f"Failed to crawl {link}: {e}")
-                    continue
-
-        finally:
-            await page.close()
+                    return None
+
+        for link, result in zip(
+            pending_links,
+            await asyncio.gather(
+                *(_scrape_one(link) for link in pending_links), return_exceptions=True
+            ),
+        ):
+            # A failure outside the per-link handler must not drop the other pages
+            if isinstance(result, Exception):
+                logging.warning(f"Failed to crawl {link}: {result}")
+            elif result:
+                results.append(result)
+
+        if include_ai_summary:
+            await self._attach_page_analyses(results)
 
         return results
 
+    def _load_sessions(self) -> Dict[str, Any]:
+        """Return saved sessions, reading the sessions file only once."""
+        if self._sessions_cache is None:
+            if os.path.exists(self.sessions_file):
+                with open(self.sessions_file, "rb") as f:
+                    self._sessions_cache = _json_loads(f.read())
+            else:
+                self._sessions_cache = {}
+        return self._sessions_cache
+
+    def _write_sessions(self, sessions: Dict[str, Any]):
+        """Atomically replace the sessions file so concurrent saves never corrupt it."""
+        tmp_path = f"{self.sessions_file}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(_json_dumps_pretty(sessions))
+        os.replace(tmp_path, self.sessions_file)
+
+    async def _sessions(self) -> Dict[str, Any]:
+        """Return saved sessions, loading the file off the event loop on first use."""
+        if self._sessions_cache is None:
+            return await asyncio.to_thread(self._load_sessions)
+        return self._sessions_cache
+
     async def _save_session(self, page: Page, url: str):
         """Save browser session for reuse."""
         try:
             cookies = await page.context.cookies()
-            domain = urlparse(url).netloc
-
-            sessions = {}
-            if os.path.exists(self.sessions_file):
-                with open(self.sessions_file, "r") as f:
-                    sessions = json.load(f)
-
-            sessions[domain] = {"cookies": cookies, "url": url}
-
-            with open(self.sessions_file, "w") as f:
-                json.dump(sessions, f, indent=2)
+            domain = _netloc(url)
+
+            if self._session_lock is None:
+                self._session_lock = asyncio.Lock()
+            async with self._session_lock:
+                sessions = await self._sessions()
+                sessions[domain] = {"cookies": cookies, "url": url}
+                # Other pooled contexts must pick up the fresh cookies
+                self._restored_sessions = {
+                    key for key in self._restored_sessions if key[1] != domain
+                }
+                # Write a copy so later in-memory updates cannot race the dump
+                await asyncio.to_thread(self._write_sessions, dict(sessions))
 
         except Exception as e:
             logging.warning(f"Failed to save session: {e}")
 
     async def _restore_session(self, page: Page, url: str):
-        """Restore saved browser session."""
+        """Restore saved browser session, once per pooled context and domain."""
         try:
-            domain = urlparse(url).netloc
-
-            if not os.path.exists(self.sessions_file):
+            domain = _netloc(url)
+            key = (id(page.context), domain)
+            if key in self._restored_sessions:
                 return
 
-            with open(self.sessions_file, "r") as f:
-                sessions = json.load(f)
+            sessions = await self._sessions()
 
             if domain in sessions:
                 cookies = sessions[domain]["cookies"]
                 await page.context.add_cookies(cookies)
+                self._restored_sessions.add(key)
 
         except Exception as e:
             logging.warning(f"Failed to restore session: {e}")
 
-    async def _handle_2fa_if_present(self, page: Page):
-        """Handle 2-factor authentication if detected."""
-        try:
-            # Common 2FA indicators
-            twofa_indicators = [
-                "verification code",
-                "two-factor",
-                "2fa",
-                "authenticator",
-                "security code",
-                "verify",
-                "code",
-                "authentication",
-            ]
+    async def _handle_2fa_if_present(
+        self, page: Page, initial_content: Optional[str] = None
+    ) -> bool:
+        """Handle 2-factor authentication if detected.
 
-            page_content = await page.content()
-            page_text = page_content.lower()
+        Returns True when a 2FA prompt was found, meaning the page may have changed.
+        """
+        detected = False
+        try:
+            page_content = (
+                initial_content if initial_content is not None else await page.content()
+            )
 
             # Check if 2FA is required
-            if any(indicator in page_text for indicator in twofa_indicators):
+            if _TWOFA_INDICATORS.search(page_content):
+                detected = True
                 logging.info("2FA detected, waiting for user intervention...")
 
-                # Wait for user to manually handle 2FA (up to 5 minutes)
-                for i in range(60):  # 60 * 5 seconds = 5 minutes
-                    await asyncio.sleep(5)
-                    current_content = await page.content()
-
-                    # Check if we've moved past 2FA
-                    if not any(
-                        indicator in current_content.lower()
-                        for indicator in twofa_indicators
-                    ):
-                        logging.info("2FA completed successfully")
-                        return
-
-                    # Log progress every 30 seconds
-                    if i % 6 == 0:
-                        logging.info(
-                            f"Still waiting for 2FA completion... ({(i+1)*5} seconds elapsed)"
-                        )
-
-                logging.warning(
-                    "2FA timeout after 5 minutes - user may need to complete manually"
-                )
+                # Wait in-browser for the 2FA prompt to disappear (up to 5 minutes)
+                try:
+                    await page.wait_for_function(
+                        _TWOFA_CLEARED_JS,
+                        arg=list(_TWOFA_INDICATORS.phrases),
+                        timeout=300_000,
+                        polling=500,
+                    )
+                    logging.info("2FA completed successfully")
+                except PlaywrightTimeoutError:
+                    logging.warning(
+                        "2FA timeout after 5 minutes - user may need to complete manually"
+                    )
 
         except Exception as e:
             logging.warning(f"Error handling 2FA: {e}")
 
+        return detected
+
     async def _handle_press_and_hold_challenge(self, page: Page) -> bool:
         """Handle Zillow-style press-and-hold bot verification challenges."""
         try:
@@ -685,6 +1656,40 @@ Use specific selectors like input[type="email"], input[name="username"], #passwo
             logging.warning("Failed to handle Press & Hold challenge: %s", exc)
             return False
 
+    async def _first_visible_selector(
+        self, page: Page, selectors: Tuple[str, ...]
+    ) -> Optional[str]:
+        """Return the highest-priority selector with a visible match.
+
+        Candidates are checked together in the page, so a missing field costs a
+        single timeout, while a detected selector still wins over a generic
+        fallback that appears earlier in the document.
+        """
+        try:
+            handle = await page.wait_for_function(
+                _FIRST_VISIBLE_SELECTOR_JS,
+                arg=list(selectors),
+                timeout=LOGIN_FIELD_TIMEOUT,
+            )
+        except PlaywrightTimeoutError:
+            return None
+        return await handle.json_value()
+
+    async def _fill_login_field(
+        self, page: Page, selectors: Tuple[str, ...], value: str
+    ) -> bool:
+        """Fill the visible field matched by the highest-priority selector."""
+        selector = await self._first_visible_selector(page, selectors)
+        if selector is None:
+            return False
+        try:
+            field = page.locator(_visible_only(selector)).first
+            await field.fill(value, timeout=LOGIN_FIELD_TIMEOUT)
+            return True
+        except Exception as e:
+            logging.debug(f"Login selector {selector!r} failed: {e}")
+            return False
+
     async def _simulate_human_interaction(self, page: Page):
         """Introduce randomness to mimic human behavior."""
         try:
@@ -699,19 +1704,21 @@ Use specific selectors like input[type="email"], input[name="username"], #passwo
                 alt_y = min(viewport["height"] - 10, max(10, base_y + random.uniform(-150, 150)))
                 await page.mouse.move(alt_x, alt_y, steps=random.randint(4, 10))
 
-            # Random scroll bursts
-            for _ in range(random.randint(1, 3)):
-                scroll_distance = random.randint(150, 600)
-                await page.mouse.wheel(0, scroll_distance)
-                await asyncio.sleep(random.uniform(0.3, 1.1))
+            # Random scroll bursts as (delta, pause in ms) steps
+            plan = [
+                [random.randint(150, 600), random.randint(300, 1100)]
+                for _ in range(random.randint(1, 3))
+            ]
 
             # Chance to scroll back up slightly
             if random.random() < 0.3:
-                await page.mouse.wheel(0, -random.randint(80, 200))
-                await asyncio.sleep(random.uniform(0.2, 0.8))
+                plan.append([-random.randint(80, 200), random.randint(200, 800)])
 
             # Micro idle time to simulate reading
-            await asyncio.sleep(random.uniform(1.0, 3.0))
+            plan.append([0, random.randint(1000, 3000)])
+
+            # Play the whole plan in the browser with a single round-trip
+            await page.evaluate(_SCROLL_PLAN_JS, plan)
         except Exception as exc:
             logging.debug("Human interaction simulation failed: %s", exc)
 
@@ -720,45 +1727,46 @@ Use specific selectors like input[type="email"], input[name="username"], #passwo
         submit_selector = login_selectors["submit"]
         submit_clicked = False
 
-        # First try the detected selector
+        # Try the detected selector and common patterns in a single round-trip
         try:
-            await page.click(submit_selector, timeout=5000)
-            submit_clicked = True
+            clicked = await page.evaluate(
+                _CLICK_SUBMIT_JS,
+                [[submit_selector, *_SUBMIT_FALLBACKS], list(_SUBMIT_BUTTON_TEXTS)],
+            )
+            submit_clicked = clicked is not None
         except Exception:
             pass
 
-        # If that fails, try common submit button patterns
+        # Otherwise let Playwright click, with its actionability checks, the
+        # highest-priority visible submit control anywhere on the page
         if not submit_clicked:
-            common_submit_selectors = [
-                "input[type='submit']",
-                "button[type='submit']",
-                "button:has-text('Login')",
-                "button:has-text('Sign in')",
-                "button:has-text('Log in')",
-                "[role='button']:has-text('Login')",
-                "[role='button']:has-text('Sign in')",
-            ]
-
-            for selector in common_submit_selectors:
-                try:
-                    await page.click(selector, timeout=3000)
+            selector = await self._first_visible_selector(
+                page, (submit_selector, *_SUBMIT_FALLBACKS)
+            )
+            if selector is not None:
+                with contextlib.suppress(Exception):
+                    await page.locator(_visible_only(selector)).first.click(
+                        timeout=LOGIN_FIELD_TIMEOUT
+                    )
                     submit_clicked = True
-                    break
-                except Exception:
-                    continue
 
-        # If still no success, try pressing Enter on password field
+        # If nothing was clicked, press Enter in the highest-priority visible
+        # password field
         if not submit_clicked:
-            try:
-                await page.press(login_selectors["password"], "Enter")
-                submit_clicked = True
-            except Exception:
-                pass
+            selector = await self._first_visible_selector(
+                page, (login_selectors["password"], *_PASSWORD_FALLBACKS)
+            )
+            if selector is not None:
+                with contextlib.suppress(Exception):
+                    await page.locator(_visible_only(selector)).first.press(
+                        "Enter", timeout=LOGIN_FIELD_TIMEOUT
+                    )
+                    submit_clicked = True
 
         # Return error if submit failed
         if not submit_clicked:
             return {
-                "name": f"Login Error: {urlparse(page.url).netloc}",
+                "name": f"Login Error: {_netloc(page.url)}",
                 "content": f"Could not find or click submit button. Tried selector: {submit_selector}",
                 "url": page.url,
             }
@@ -772,101 +1780,190 @@ Use specific selectors like input[type="email"], input[name="username"], #passwo
         username: str = None,
         password: str = None,
         login_selectors: Optional[Dict[str, str]] = None,
+        include_ai_summary: bool = False,
     ) -> List[Dict[str, str]]:
-        """Navigate to multiple URLs after authentication and scrape content."""
+        """Navigate to multiple URLs after authentication and scrape content.
+
+        With ``include_ai_summary``, the scraped pages are analyzed together
+        after navigation, several pages per LLM request.
+        """
 
         if not self.browser:
             raise RuntimeError("Browser not initialized. Use async context manager.")
 
         results = []
-        page = await self.browser.new_page()
 
-        try:
-            # If credentials provided, login first
-            if username and password:
-                login_result = await self.scrape_with_login(
-                    base_url, username, password, login_selectors, save_session=True
-                )
+        # If credentials provided, login first
+        if username and password:
+            login_result = await self.scrape_with_login(
+                base_url, username, password, login_selectors, save_session=True
+            )
 
-                if "Error" in login_result["name"] or "Failed" in login_result["name"]:
-                    return [login_result]
+            if "Error" in login_result["name"] or "Failed" in login_result["name"]:
+                return [login_result]
 
-                results.append(login_result)
-            else:
-                # Just navigate to base URL and restore session
-                await self._restore_session(page, base_url)
-                await page.goto(base_url, wait_until="networkidle")
+            results.append(login_result)
 
-            # Navigate to each target URL
-            for url in target_urls:
+        async def _scrape_one(url: str) -> Dict[str, str]:
+            netloc = _netloc(url)
+            async with self._pooled_page() as page:
                 try:
+                    await self._restore_session(page, base_url)
+
                     logging.info(f"Navigating to: {url}")
-                    await page.goto(url, wait_until="networkidle")
-
-                    # Wait a bit for dynamic content
-                    await asyncio.sleep(2)
-
-                    content = await page.content()
-                    soup = BeautifulSoup(content, "html.parser")
-
-                    # Clean content
-                    for tag in soup(
-                        ["nav", "footer", "aside", "script", "style", "header"]
-                    ):
-                        tag.decompose()
-
-                    # Extract main content
-                    if main_content := (
-                        soup.find("main")
-                        or soup.find("article")
-                        or soup.find(
-                            "div", class_=lambda x: x and "content" in x.lower()
-                        )
-                    ):
-                        text_content = main_content.get_text(separator="\n", strip=True)
-                    else:
-                        text_content = soup.get_text(separator="\n", strip=True)
-
-                    # Clean up text
-                    lines = [
-                        line.strip()
-                        for line in text_content.split("\n")
-                        if line.strip()
-                    ]
-                    clean_content = "\n".join(lines)
-
-                    title = soup.find("title")
-                    page_title = (
-                        title.get_text().strip()
-                        if title
-                        else f"Page from {urlparse(url).netloc}"
+                    response = await page.goto(
+                        url, wait_until="domcontentloaded", timeout=NAV_TIMEOUT
                     )
-
-                    results.append(
-                        {
-                            "name": f"Navigated: {page_title}",
-                            "content": clean_content,
+                    if _exceeds_size_limit(response):
+                        return {
+                            "name": f"Skipped: {netloc}",
+                            "content": f"Skipped {url}: response is larger than {MAX_TRANSFER_BYTES:,} bytes.",
                             "url": url,
                         }
+
+                    # Wait briefly for main content instead of a fixed delay
+                    with contextlib.suppress(PlaywrightTimeoutError):
+                        await page.wait_for_selector(
+                            _MAIN_CONTENT_SELECTOR, timeout=CONTENT_WAIT_TIMEOUT
+                        )
+
+                    # Read rendered text in the browser instead of serializing the DOM
+                    page_text = await page.evaluate(
+                        _PAGE_TEXT_JS,
+                        [_tag_selector(_CHROME_TAGS), MAX_HTML_CHARS, _MAIN_CONTENT_ROOTS],
                     )
+                    clean_content = clean_text(page_text["text"])
+                    page_title = page_text["title"].strip() or f"Page from {netloc}"
+
+                    return {
+                        "name": f"Navigated: {page_title}",
+                        "content": clean_content,
+                        "url": url,
+                    }
 
                 except Exception as e:
                     logging.warning(f"Failed to navigate to {url}: {e}")
-                    results.append(
-                        {
-                            "name": f"Navigation Error: {urlparse(url).netloc}",
-                            "content": f"Failed to navigate to {url}: {str(e)}",
-                            "url": url,
-                        }
-                    )
+                    return {
+                        "name": f"Navigation Error: {netloc}",
+                        "content": f"Failed to navigate to {url}: {str(e)}",
+                        "url": url,
+                    }
 
-        finally:
-            await page.close()
+        # Navigate to each target URL, a bounded number at a time
+        for url, result in zip(
+            target_urls,
+            await asyncio.gather(
+                *(_scrape_one(url) for url in target_urls), return_exceptions=True
+            ),
+        ):
+            if isinstance(result, Exception):
+                result = {
+                    "name": f"Navigation Error: {_netloc(url)}",
+                    "content": f"Failed to navigate to {url}: {result}",
+                    "url": url,
+                }
+            results.append(result)
+
+        if include_ai_summary:
+            await self._attach_page_analyses(results)
 
         return results
 
 
+# Statuses that signal rate limiting and trigger a per-host backoff
+_THROTTLE_STATUSES = frozenset({429, 503})
+
+
+def _increase_backoff(backoff: Dict[str, float], host: str):
+    """Double the host's crawl delay with jitter, starting at ~2s and capped at 60s."""
+    current = backoff.get(host, 1.0)
+    backoff[host] = min(current * 2, 60.0) + random.uniform(0, 0.5)
+
+
+def _new_url_filter():
+    """Return a memory-bounded set of seen URLs for the crawl frontier.
+
+    A scalable Bloom filter keeps memory near 10 bits per URL; its rare false
+    positives only skip a duplicate-looking link. Falls back to a plain set.
+    """
+    if ScalableBloomFilter is not None:
+        return ScalableBloomFilter(initial_capacity=10_000, error_rate=1e-4)
+    return set()
+
+
 # Synchronous wrapper functions for GUI integration
+_SYNC_LOOP: Optional[asyncio.AbstractEventLoop] = None
+_SYNC_LOOP_LOCK = threading.Lock()
+
+
+def _relay_to_caller(callback: Callable, calls: queue.Queue) -> Callable:
+    """Wrap ``callback`` so each call runs on the thread waiting in ``_run_sync``.
+
+    The loop thread queues the arguments and awaits the reply, keeping GUI
+    callbacks on the thread that owns the widgets.
+    """
+
+    async def _relay(*args):
+        reply: concurrent.futures.Future = concurrent.futures.Future()
+        calls.put((callback, args, reply))
+        result = await asyncio.wrap_future(reply)
+        if inspect.isawaitable(result):
+            result = await result
+        return result
+
+    return _relay
+
+
+def _run_sync(coro, calls: Optional[queue.Queue] = None):
+    """Run a coroutine on a shared background event loop and wait for its result.
+
+    Reusing one long-lived loop avoids creating and tearing down an event loop
+    for every call made by the GUI. Callbacks relayed through ``calls`` are run
+    on the calling thread while it waits.
+    """
+    global _SYNC_LOOP
+    with _SYNC_LOOP_LOCK:
+        if _SYNC_LOOP is None:
+            _SYNC_LOOP = asyncio.new_event_loop()
+            threading.Thread(
+                target=_SYNC_LOOP.run_forever, name="scraper-loop", daemon=True
+            ).start()
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:  # No loop runs on this thread
+        running = None
+    if running is _SYNC_LOOP:
+        # Blocking here would wait on the very loop that has to run the coroutine
+        coro.close()
+        raise RuntimeError(
+            "Synchronous scraper calls cannot be made from the scraper loop"
+        )
+    future = asyncio.run_coroutine_threadsafe(coro, _SYNC_LOOP)
+    while calls is not None and not future.done():
+        try:
+            callback, args, reply = calls.get(timeout=0.05)
+        except queue.Empty:
+            continue
+        if not reply.set_running_or_notify_cancel():
+            continue
+        try:
+            reply.set_result(callback(*args))
+        except BaseException as exc:  # noqa: BLE001 - re-raised inside the loop
+            reply.set_exception(exc)
+    return future.result()
+
+
+@atexit.register
+def _shutdown_sync_loop():
+    """Close the shared browser when the application exits."""
+    if _SYNC_LOOP is None or not _SYNC_LOOP.is_running():
+        return
+    with contextlib.suppress(Exception):
+        asyncio.run_coroutine_threadsafe(_close_shared_browser(), _SYNC_LOOP).result(
+            timeout=10
+        )
+
+
 async def playwright_crawl(
     start_url: str,
     max_pages: int = 10,
@@ -878,10 +1975,11 @@ async def playwright_crawl(
     progress_callback: Optional[
         Callable[[Dict[str, Any]], Awaitable[bool] | bool]
     ] = None,
+    reuse_browser: bool = False,
 ) -> List[Dict[str, str]]:
     """Generic Playwright-based crawler that works with or without authentication."""
 
-    async with AuthenticatedScraper() as scraper:
+    async with AuthenticatedScraper(reuse_browser=reuse_browser) as scraper:
         results: List[Dict[str, str]] = []
 
         if username and password:
@@ -896,133 +1994,172 @@ async def playwright_crawl(
         if not scraper.browser:
             return results
 
-        try:
-            visited: set[str] = set()
-            queue: List[str] = [start_url]
-            parsed_count = 0
+        base_domain = _netloc(start_url)
+        # The frontier is deque-backed; seen marks URLs on enqueue so each loads once
+        frontier: asyncio.Queue = asyncio.Queue()
+        frontier.put_nowait(start_url)
+        seen = _new_url_filter()
+        seen.add(start_url)
+        # Pages claimed by workers, so concurrent loads never overshoot max_pages
+        claimed = 0
+        # URLs held back while every page slot is claimed, requeued if a load fails
+        deferred: collections.deque = collections.deque()
+        stopped = False
+        analysis_tasks: List[asyncio.Task] = []
+        # Per-host delay (seconds) applied after throttling or bot challenges
+        backoff: Dict[str, float] = {}
+
+        async def _publish(result_entry: Dict[str, Any]):
+            """Attach the optional analysis, record the entry and report progress."""
+            nonlocal stopped
+            if include_ai_summary:
+                analysis_info = await scraper._generate_page_analysis(
+                    result_entry["url"], result_entry["content"], include_followups=True
+                )
+                if analysis_info:
+                    result_entry["analysis"] = analysis_info.get("analysis")
+                    result_entry["followups"] = analysis_info.get("followups", [])
 
-            while queue and parsed_count < max_pages:
-                url = queue.pop(0)
-                if url in visited:
-                    continue
-                visited.add(url)
+            # The crawl may have been stopped while the analysis ran
+            if stopped:
+                return
 
-                success = False
-                last_exception: Optional[Exception] = None
-                page = None
+            results.append(result_entry)
 
-                for attempt in range(3):
-                    attempt_page = await scraper.browser.new_page()
-                    attempt_page.set_default_navigation_timeout(45000)
+            if progress_callback:
+                callback_result = progress_callback(result_entry)
+                if inspect.isawaitable(callback_result):
+                    callback_result = await callback_result
+                if callback_result is False:
+                    stopped = True
 
-                    try:
-                        await scraper._restore_session(attempt_page, url)
-                        await attempt_page.goto(url, wait_until="domcontentloaded")
-                        await attempt_page.wait_for_timeout(random.randint(1500, 3500))
-                        await scraper._simulate_human_interaction(attempt_page)
+        async def _crawl_one(url: str) -> bool:
+            """Load one page and publish it, returning False if it failed to load."""
+            last_exception: Optional[Exception] = None
 
-                        try:
-                            await attempt_page.wait_for_load_state("networkidle", timeout=20000)
-                        except Exception:
-                            await attempt_page.wait_for_selector("body", timeout=8000)
+            for attempt in range(3):
+                async with scraper._pooled_page() as page:
+                    page.set_default_navigation_timeout(45000)
 
-                        await scraper._handle_press_and_hold_challenge(attempt_page)
+                    host = _netloc(url)
+                    try:
+                        # Only pause when this host has recently pushed back
+                        if delay := backoff.get(host):
+                            await asyncio.sleep(delay)
+
+                        await scraper._restore_session(page, url)
+                        response = await page.goto(url, wait_until="domcontentloaded")
+                        if response is not None and response.status in _THROTTLE_STATUSES:
+                            _increase_backoff(backoff, host)
+                            raise RuntimeError(
+                                f"Server throttled the request (HTTP {response.status})"
+                            )
+                        await scraper._simulate_human_interaction(page)
 
-                        success = True
-                        page = attempt_page
-                        break
+                        try:
+                            await page.wait_for_selector(
+                                _MAIN_CONTENT_SELECTOR, timeout=CONTENT_WAIT_TIMEOUT
+                            )
+                        except PlaywrightTimeoutError:
+                            await page.wait_for_selector("body", timeout=8000)
+
+                        if await scraper._handle_press_and_hold_challenge(page):
+                            _increase_backoff(backoff, host)
+                        else:
+                            backoff.pop(host, None)
                     except Exception as exc:
                         logging.warning(
                             "Attempt %d failed to load %s: %s",
                             attempt + 1,
                             url,
-{{ ... }}
+                            exc,
                         )
                         last_exception = exc
-                    finally:
-                        if not success:
-                            await attempt_page.close()
-
-                if not success or page is None:
-                    results.append(
-                        {
-                            "name": f"Navigation Timeout: {urlparse(url).netloc}",
-                            "content": f"Failed to load {url} after multiple attempts. Last error: {last_exception}",
-                            "url": url,
-                        }
-                    )
-                    continue
-
-                html = await page.content()
-                soup = BeautifulSoup(html, "html.parser")
-
-                for tag in soup(["nav", "footer", "aside", "script", "style", "header"]):
-                    tag.decompose()
-
-                text_content = soup.get_text(separator="\n", strip=True)
-                clean_lines = [line.strip() for line in text_content.split("\n") if line.strip()]
-                clean_content = "\n".join(clean_lines)
+                        continue
 
-                title = soup.find("title")
-                analysis_info = None
-                if include_ai_summary:
-                    analysis_info = await scraper._generate_page_analysis(
-                        url, clean_content, include_followups=True
+                    # Collect links before the text pass strips navigation
+                    link_hrefs = await page.evaluate(
+                        _CRAWL_LINKS_JS,
+                        {"base": base_domain, "same": same_domain_only},
+                    )
+                    # Read rendered text in the browser instead of serializing the DOM
+                    page_text = await page.evaluate(
+                        _PAGE_TEXT_JS, [_tag_selector(_CHROME_TAGS), MAX_HTML_CHARS, []]
                     )
 
+                clean_content = clean_text(page_text["text"])
                 result_entry: Dict[str, Any] = {
-                    "name": f"Crawled: {title.get_text().strip() if title else urlparse(url).netloc}",
+                    "name": f"Crawled: {page_text['title'].strip() or _netloc(url)}",
                     "content": clean_content,
                     "url": url,
                 }
 
-                if analysis_info:
-                    result_entry["analysis"] = analysis_info.get("analysis")
-                    result_entry["followups"] = analysis_info.get("followups", [])
-
-                link_hrefs = await page.evaluate(
-                    """
-                    () => Array.from(document.querySelectorAll('a[href]'))
-                        .map(a => a.href)
-                        .filter(Boolean)
-                    """
-                )
-
                 candidate_links: List[str] = []
 
-                base_domain = urlparse(start_url).netloc
-
                 for href in link_hrefs:
-                    parsed = urlparse(href)
-                    if parsed.scheme not in {"http", "https"}:
-                        continue
-                    if same_domain_only and parsed.netloc != base_domain:
-                        continue
-                    if href in visited or href in queue:
+                    if href in seen:
                         continue
+                    seen.add(href)
                     candidate_links.append(href)
-                    queue.append(href)
+                    frontier.put_nowait(href)
 
                 result_entry["candidate_links"] = candidate_links[:10]
 
-                results.append(result_entry)
-                parsed_count += 1
+                # Pages still loading when the crawl was stopped are dropped
+                if stopped:
+                    return True
+                if include_ai_summary:
+                    # Let the worker move on while the LLM analyzes this page
+                    analysis_tasks.append(asyncio.create_task(_publish(result_entry)))
+                else:
+                    await _publish(result_entry)
+                return True
 
-                if progress_callback:
-                    callback_result = progress_callback(result_entry)
-                    if inspect.isawaitable(callback_result):
-                        callback_result = await callback_result
-                    if callback_result is False:
-                        await page.close()
-                        break
+            results.append(
+                {
+                    "name": f"Navigation Timeout: {_netloc(url)}",
+                    "content": f"Failed to load {url} after multiple attempts. Last error: {last_exception}",
+                    "url": url,
+                }
+            )
+            return False
 
-                if parsed_count >= max_pages:
-                    break
-                await page.close()
+        async def _worker():
+            nonlocal claimed
+            while True:
+                url = await frontier.get()
+                try:
+                    # Drain the frontier without loading once the crawl is over
+                    if stopped:
+                        continue
+                    if claimed >= max_pages:
+                        deferred.append(url)
+                        continue
+                    claimed += 1
+                    published = False
+                    try:
+                        published = await _crawl_one(url)
+                    except Exception as exc:  # noqa: BLE001
+                        logging.warning("Failed to crawl %s: %s", url, exc)
+                    finally:
+                        if not published:
+                            # Failed pages do not count toward max_pages, so hand
+                            # the freed slot to a held-back URL
+                            claimed -= 1
+                            if deferred and not stopped:
+                                frontier.put_nowait(deferred.popleft())
+                finally:
+                    frontier.task_done()
+
+        # Each worker draws from the shared frontier and borrows a pooled context
+        workers = [asyncio.create_task(_worker()) for _ in range(MAX_PARALLEL_PAGES)]
+        try:
+            await frontier.join()
+            await asyncio.gather(*analysis_tasks)
         finally:
-            with contextlib.suppress(Exception):
-                if page is not None:
-                    await page.close()
+            for task in (*workers, *analysis_tasks):
+                task.cancel()
+            await asyncio.gather(*workers, *analysis_tasks, return_exceptions=True)
 
         return results
 
@@ -1036,12 +2173,12 @@ def scrape_with_login_sync(
     """Synchronous wrapper for authenticated scraping."""
 
     async def _scrape():
-        async with AuthenticatedScraper() as scraper:
+        async with AuthenticatedScraper(reuse_browser=True) as scraper:
             return await scraper.scrape_with_login(
                 url, username, password, login_selectors
             )
 
-    return asyncio.run(_scrape())
+    return _run_sync(_scrape())
 
 
 def crawl_with_login_sync(
@@ -1050,16 +2187,22 @@ def crawl_with_login_sync(
     password: str,
     max_pages: int = 3,
     login_selectors: Optional[Dict[str, str]] = None,
+    include_ai_summary: bool = False,
 ) -> List[Dict[str, str]]:
     """Synchronous wrapper for authenticated crawling."""
 
     async def _crawl():
-        async with AuthenticatedScraper() as scraper:
+        async with AuthenticatedScraper(reuse_browser=True) as scraper:
             return await scraper.crawl_with_login(
-                url, username, password, max_pages, login_selectors
+                url,
+                username,
+                password,
+                max_pages,
+                login_selectors,
+                include_ai_summary=include_ai_summary,
             )
 
-    return asyncio.run(_crawl())
+    return _run_sync(_crawl())
 
 
 def navigate_and_scrape_sync(
@@ -1068,16 +2211,22 @@ def navigate_and_scrape_sync(
     username: str = None,
     password: str = None,
     login_selectors: Optional[Dict[str, str]] = None,
+    include_ai_summary: bool = False,
 ) -> List[Dict[str, str]]:
     """Synchronous wrapper for navigation and scraping."""
 
     async def _navigate():
-        async with AuthenticatedScraper() as scraper:
+        async with AuthenticatedScraper(reuse_browser=True) as scraper:
             return await scraper.navigate_and_scrape(
-                base_url, target_urls, username, password, login_selectors
+                base_url,
+                target_urls,
+                username,
+                password,
+                login_selectors,
+                include_ai_summary=include_ai_summary,
             )
 
-    return asyncio.run(_navigate())
+    return _run_sync(_navigate())
 
 
 def playwright_crawl_sync(
@@ -1093,6 +2242,9 @@ def playwright_crawl_sync(
     ] = None,
 ) -> List[Dict[str, str]]:
     """Synchronous wrapper for the generic Playwright crawler."""
+    calls: queue.Queue = queue.Queue()
+    if progress_callback is not None:
+        progress_callback = _relay_to_caller(progress_callback, calls)
 
     async def _crawl():
         return await playwright_crawl(
@@ -1104,29 +2256,85 @@ def playwright_crawl_sync(
             login_selectors=login_selectors,
             include_ai_summary=include_ai_summary,
             progress_callback=progress_callback,
+            reuse_browser=True,
         )
 
-    return asyncio.run(_crawl())
+    return _run_sync(_crawl(), calls)
 
 
-def analyze_login_form_sync(url: str) -> Dict[str, str]:
-    """Analyze a page to detect login form elements."""
-    try:
+# Connect and read timeouts for plain HTTP fetches; the connect timeout sits just
+# above a TCP retransmission window so a single dropped SYN is not fatal
+HTTP_TIMEOUT = (3.05, 10)
+
+# Bytes of a page downloaded when looking for its login form
+LOGIN_PAGE_READ_LIMIT = 256 * 1024
+
+_HTTP_SESSION: Optional[requests.Session] = None
+
+
+def _http_session() -> requests.Session:
+    """Return a shared HTTP session so repeat fetches reuse pooled connections."""
+    global _HTTP_SESSION
+    if _HTTP_SESSION is None:
+        _HTTP_SESSION = requests.Session()
         # Add headers to appear more like a real browser
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-            "Accept-Language": "en-US,en;q=0.5",
-            "Accept-Encoding": "gzip, deflate",
-            "Connection": "keep-alive",
-            "Upgrade-Insecure-Requests": "1",
-        }
+        _HTTP_SESSION.headers.update(
+            {
+                "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+                "Accept-Language": "en-US,en;q=0.5",
+                "Accept-Encoding": "gzip, deflate",
+                "Connection": "keep-alive",
+                "Upgrade-Insecure-Requests": "1",
+            }
+        )
+        # Keep connections pooled per host and retry transient gateway errors
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=2, backoff_factor=0.3, status_forcelist=(502, 503, 504)
+            ),
+        )
+        _HTTP_SESSION.mount("https://", adapter)
+        _HTTP_SESSION.mount("http://", adapter)
+    return _HTTP_SESSION
+
 
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()
+def analyze_login_form_sync(url: str, use_cache: bool = True) -> Dict[str, str]:
+    """Analyze a page to detect login form elements.
 
-        scraper = AuthenticatedScraper()
-        return scraper.analyze_login_form(response.text)
+    Explicit user requests pass ``use_cache=False`` so a changed login form is
+    always re-analyzed rather than served from the selector caches.
+    """
+    site = _netloc(url)
+    if use_cache and (cached := _SITE_SELECTOR_CACHE.get(site)):
+        return dict(cached)
+
+    try:
+        with _http_session().get(url, timeout=HTTP_TIMEOUT, stream=True) as response:
+            response.raise_for_status()
+
+            content_type = response.headers.get("content-type", "")
+            if content_type and "html" not in content_type:
+                return {"error": f"Not an HTML page ({content_type})"}
+
+            # The login form sits near the top, so skip the rest of large pages
+            body = bytearray()
+            for chunk in response.iter_content(chunk_size=65536):
+                body += chunk
+                if len(body) >= LOGIN_PAGE_READ_LIMIT:
+                    break
+            html = bytes(body[:LOGIN_PAGE_READ_LIMIT]).decode(
+                response.encoding or "utf-8", errors="replace"
+            )
+
+        selectors = AuthenticatedScraper.analyze_login_form(
+            html, site, use_cache=use_cache
+        )
+        if "error" not in selectors:
+            _SITE_SELECTOR_CACHE[site] = dict(selectors)
+        return selectors
 
     except requests.exceptions.HTTPError as e:
         if e.response.status_code == 403:
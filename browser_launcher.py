@@ -3,15 +3,399 @@ Simple GUI for launching Chrome with remote debugging.
 Integrates with the authenticated scraper for existing browser sessions.
 """
 
+import contextlib
+import hashlib
+import http.client
+import json
 import logging
+import os
+import queue
+import re
+import select
+import shutil
+import signal
+import socket
+import stat
 import subprocess
 import threading
 import time
 import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from tkinter import messagebox, ttk
 
-from launch_chrome_debug import find_chrome_path, is_port_in_use
+from launch_chrome_debug import CHROME_DEBUG_FLAGS, find_chrome_path, is_port_in_use
+
+try:
+    import psutil
+except ImportError:  # Fall back to lsof and ps subprocesses
+    psutil = None
+
+# Longest wait for a launched Chrome to open its debugging port (seconds)
+LAUNCH_TIMEOUT = 10.0
+# Pause between port probes while Chrome starts, cut short if Chrome exits
+_PORT_PROBE_INTERVAL = 0.1
+# Grace period before processes that ignored SIGTERM are killed (seconds)
+STOP_GRACE_PERIOD = 2.0
+# Interval between checks for a terminated Chrome to exit (ms)
+_EXIT_POLL_MS = 200
+# Seconds a DevTools /json tab listing is reused by repeated status checks
+_TABS_CACHE_TTL = 0.5
+# Interval between background status checks (ms)
+STATUS_POLL_MS = 1000
+# Interval at which the Tk thread runs results handed back by worker threads (ms)
+_UI_DRAIN_MS = 100
+
+
+# Chrome executable found by an earlier launch
+_CHROME_PATH = None
+
+
+def _chrome_path():
+    """Return the Chrome executable, searching only until it has been found once."""
+    global _CHROME_PATH
+    if _CHROME_PATH is None:
+        _CHROME_PATH = find_chrome_path()
+    return _CHROME_PATH
+
+
+@contextlib.contextmanager
+def _process_exit_waiter(pid):
+    """Yield a wait(timeout) callable that returns early once the process exits.
+
+    Uses a pidfd on Linux and kqueue on macOS so the waiting thread is woken by
+    the kernel, falling back to a plain sleep elsewhere.
+    """
+    if hasattr(os, "pidfd_open"):
+        try:
+            pidfd = os.pidfd_open(pid)
+        except OSError:
+            pidfd = None
+        if pidfd is not None:
+            poller = select.poll()
+            poller.register(pidfd, select.POLLIN)
+            try:
+                yield lambda timeout: poller.poll(timeout * 1000)
+            finally:
+                os.close(pidfd)
+            return
+    if hasattr(select, "kqueue"):
+        kq = select.kqueue()
+        try:
+            kq.control(
+                [
+                    select.kevent(
+                        pid,
+                        filter=select.KQ_FILTER_PROC,
+                        flags=select.KQ_EV_ADD | select.KQ_EV_ONESHOT,
+                        fflags=select.KQ_NOTE_EXIT,
+                    )
+                ],
+                0,
+            )
+        except OSError:
+            kq.close()
+        else:
+            try:
+                yield lambda timeout: kq.control(None, 1, timeout)
+            finally:
+                kq.close()
+            return
+    yield time.sleep
+
+
+def _port_accepts_connections(port):
+    """Return True if something is listening on the local port."""
+    try:
+        with socket.create_connection(("127.0.0.1", port), timeout=0.5):
+            return True
+    except OSError:
+        return False
+
+
+def _wait_for_debug_port(port, process, timeout=LAUNCH_TIMEOUT):
+    """Wait until Chrome serves its debugging endpoint, or exits, or time runs out."""
+    deadline = time.monotonic() + timeout
+    with _process_exit_waiter(process.pid) as wait:
+        while True:
+            if _port_accepts_connections(port) and is_port_in_use(port):
+                return True
+            remaining = deadline - time.monotonic()
+            if process.poll() is not None or remaining <= 0:
+                return False
+            wait(min(_PORT_PROBE_INTERVAL, remaining))
+
+
+def _is_chrome_name(name):
+    """Return True if a process name looks like a Chrome or Chromium browser."""
+    name = name.lower()
+    return "chrome" in name or "chromium" in name
+
+
+def _port_owner_pids(port):
+    """Return the PIDs of processes listening on the local TCP port."""
+    if psutil is None:
+        result = subprocess.run(
+            ["lsof", "-ti", f":{port}"], capture_output=True, text=True, timeout=5
+        )
+        return [int(pid) for pid in result.stdout.split()]
+
+    try:
+        return [
+            conn.pid
+            for conn in psutil.net_connections(kind="tcp")
+            if conn.pid and conn.laddr and conn.laddr.port == port
+        ]
+    except psutil.AccessDenied:
+        # macOS only lists other processes' sockets to root, so check the
+        # user's own Chrome processes one by one instead
+        pids = []
+        for proc in psutil.process_iter(["name"]):
+            if not _is_chrome_name(proc.info["name"] or ""):
+                continue
+            with contextlib.suppress(psutil.Error):
+                if any(
+                    conn.laddr and conn.laddr.port == port
+                    for conn in proc.net_connections(kind="tcp")
+                ):
+                    pids.append(proc.pid)
+        return pids
+
+
+def _process_name(pid):
+    """Return a process's command name, or an empty string if it is gone."""
+    if psutil is None:
+        result = subprocess.run(
+            ["ps", "-p", str(pid), "-o", "comm="],
+            capture_output=True,
+            text=True,
+            timeout=2,
+        )
+        return result.stdout.strip()
+    try:
+        return psutil.Process(pid).name()
+    except psutil.Error:
+        return ""
+
+
+def _chrome_pids_with_debug_flag(port):
+    """Yield PIDs of Chrome processes started with --remote-debugging-port=port.
+
+    Processes are inspected lazily, so the scan stops as soon as the caller
+    has what it needs.
+    """
+    flag = f"--remote-debugging-port={port}"
+    if psutil is None:
+        ps_result = subprocess.run(
+            ["ps", "axo", "pid=,args="], capture_output=True, text=True, timeout=5
+        )
+        for line in ps_result.stdout.splitlines():
+            pid, _, args = line.strip().partition(" ")
+            if flag in args.split() and "Chrome" in args:
+                yield int(pid)
+        return
+
+    for proc in psutil.process_iter(["name", "cmdline"]):
+        if flag in (proc.info["cmdline"] or ()) and _is_chrome_name(
+            proc.info["name"] or ""
+        ):
+            yield proc.pid
+
+
+def _terminate_pids(pids):
+    """Send SIGTERM to each PID and SIGKILL any survivors after a grace period.
+
+    The launcher's own PID is always skipped.
+    """
+    signalled = []
+    for pid in pids:
+        if pid == os.getpid():
+            continue
+        try:
+            os.kill(pid, signal.SIGTERM)
+            signalled.append(pid)
+        except (ProcessLookupError, PermissionError):
+            pass
+    if signalled:
+        timer = threading.Timer(STOP_GRACE_PERIOD, _kill_survivors, args=(signalled,))
+        timer.daemon = True
+        timer.start()
+
+
+def _kill_if_running(process):
+    """SIGKILL a Popen process that ignored SIGTERM, then reap it."""
+    if process.poll() is None:
+        process.kill()
+        with contextlib.suppress(subprocess.TimeoutExpired):
+            process.wait(timeout=1)
+
+
+def _kill_survivors(pids):
+    """SIGKILL any of the PIDs that are still running."""
+    for pid in pids:
+        with contextlib.suppress(ProcessLookupError, PermissionError):
+            os.kill(pid, signal.SIGKILL)
+
+
+# Brings the process with the PID given as the first argument to the front
+_FOCUS_PID_APPLESCRIPT = """on run argv
+    tell application "System Events"
+        set chromeProcess to first process whose unix id is (item 1 of argv as integer)
+        set frontmost of chromeProcess to true
+    end tell
+end run"""
+
+
+# Activates Google Chrome without targeting a particular process
+_ACTIVATE_CHROME_APPLESCRIPT = """tell application "Google Chrome"
+    activate
+end tell"""
+
+
+def _applescript_cache_dir():
+    """Return the per-user directory for compiled scripts, or None if unusable.
+
+    The directory is only trusted when it is a real directory owned by the
+    current user, so nobody else can plant a script for us to run.
+    """
+    if shutil.which("osacompile") is None:
+        return None
+    path = Path.home() / "Library" / "Caches" / "chrome-debug-launcher"
+    try:
+        path.mkdir(mode=0o700, parents=True, exist_ok=True)
+        info = os.lstat(path)
+    except OSError:
+        return None
+    if not stat.S_ISDIR(info.st_mode) or info.st_uid != os.getuid():
+        return None
+    return path
+
+
+def _compiled_applescript(source):
+    """Return a compiled copy of the script, compiling it on first use.
+
+    Compiled scripts are kept in the user's cache directory under a hash of
+    their source, so later runs skip AppleScript compilation entirely. Returns
+    None if osacompile is unavailable.
+    """
+    cache_dir = _applescript_cache_dir()
+    if cache_dir is None:
+        return None
+    digest = hashlib.sha1(source.encode()).hexdigest()[:16]
+    path = os.path.join(cache_dir, f"{digest}.scpt")
+    if not os.path.exists(path):
+        # Compile beside the final path and rename, so a half-written script is
+        # never picked up
+        partial_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            result = subprocess.run(
+                ["osacompile", "-o", partial_path, "-e", source],
+                capture_output=True,
+                timeout=10,
+            )
+            if result.returncode != 0:
+                return None
+            os.replace(partial_path, path)
+        except (OSError, subprocess.SubprocessError):
+            return None
+        finally:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(partial_path)
+    return path
+
+
+def _run_applescript(source, *args):
+    """Run an AppleScript with arguments, preferring its precompiled form."""
+    script = _compiled_applescript(source)
+    command = ["osascript", script] if script else ["osascript", "-e", source]
+    return subprocess.run([*command, *args], capture_output=True, text=True, timeout=5)
+
+
+# Pulls the id of every target in a raw DevTools /json listing that still has a
+# webSocketDebuggerUrl, stepping over whole JSON strings so braces or quotes
+# inside titles and URLs cannot end a target early
+_CLOSABLE_TAB_ID_RE = re.compile(
+    rb'"id"\s*:\s*"([^"\\]+)"'
+    rb'(?:[^"{}]|"(?:[^"\\]|\\.)*")*?'
+    rb'"webSocketDebuggerUrl"'
+)
+
+
+def _focus_pid(pid):
+    """Bring the process to the front, returning True on success."""
+    try:
+        applescript_result = _run_applescript(_FOCUS_PID_APPLESCRIPT, str(pid))
+    except Exception as e:
+        logging.debug("Could not focus Chrome PID %s: %s", pid, e)
+        return False
+    logging.debug(
+        "AppleScript for PID %s exited %s: %s",
+        pid,
+        applescript_result.returncode,
+        applescript_result.stderr,
+    )
+    return applescript_result.returncode == 0
+
+
+def _close_tab(port, tab_id):
+    """Ask Chrome to close one tab, ignoring failures."""
+    conn = http.client.HTTPConnection("localhost", port, timeout=1)
+    try:
+        conn.request("GET", f"/json/close/{tab_id}")
+        conn.getresponse().read()
+    except (OSError, http.client.HTTPException):
+        pass
+    finally:
+        conn.close()
+
+
+def _close_tabs(port, tab_ids):
+    """Close tabs in parallel so the wait is one round-trip rather than one per tab."""
+    if not tab_ids:
+        return
+    with ThreadPoolExecutor(max_workers=min(8, len(tab_ids))) as pool:
+        for tab_id in tab_ids:
+            pool.submit(_close_tab, port, tab_id)
+
+
+class _DevToolsClient:
+    """Kept-alive HTTP connection to Chrome's DevTools endpoint.
+
+    Each thread that talks to Chrome owns its own client.
+    """
+
+    def __init__(self):
+        self._conn = None
+
+    def request(self, port, path, method="GET"):
+        """Send a request, returning the body, or None if Chrome is unreachable or refuses."""
+        for retry in (True, False):
+            conn = self._conn
+            fresh = conn is None or conn.port != port
+            if fresh:
+                if conn is not None:
+                    conn.close()
+                conn = http.client.HTTPConnection("localhost", port, timeout=1)
+                self._conn = conn
+            try:
+                conn.request(method, path)
+                response = conn.getresponse()
+                body = response.read()
+            except (OSError, http.client.HTTPException):
+                conn.close()
+                self._conn = None
+                # Chrome may have dropped an idle kept-alive connection
+                if retry and not fresh:
+                    continue
+                return None
+            return body if response.status == 200 else None
+        return None
+
+    def close(self):
+        """Close the connection, if one is open."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
 
 
 class BrowserLauncherGUI:
@@ -26,6 +410,32 @@ class BrowserLauncherGUI:
         # Track Chrome process
         self.chrome_process = None
 
+        # Kept-alive DevTools connection used on the Tk thread, and the last
+        # /json listing as (port, monotonic time, tabs or None)
+        self._cdp = _DevToolsClient()
+        self._tabs_cache = None
+
+        # Last (state, port) shown, so periodic checks only redraw on change
+        self._last_state = None
+        self._launching = False
+        # Monotonic time until which a stopped Chrome is shown as down while it
+        # exits
+        self._stop_deadline = None
+
+        # Callbacks queued by worker threads for the Tk thread to run, the port
+        # the background status poller probes, and its stop signal
+        self._ui_calls = queue.Queue()
+        self._poll_port = None
+        self._poll_stop = threading.Event()
+
+        # After IDs of pending exit checks for terminated Chromes, by process,
+        # and whether the window has been closed
+        self._exit_checks = {}
+        self._closed = False
+
+        # (pid, port) of the Chrome last found serving the debug port
+        self._chrome_pid = None
+
         self.setup_ui()
 
     def setup_ui(self):
@@ -162,43 +572,114 @@ Benefits:
         instructions_text.insert("1.0", instructions)
         instructions_text.config(state="disabled")
 
-        # Auto-check status on startup
-        self.root.after(500, self.check_status)
+        # Run worker results on the Tk thread, and keep the status current from
+        # one long-lived background poller
+        self._status_after_id = self.root.after(_UI_DRAIN_MS, self._drain_ui_calls)
+        threading.Thread(
+            target=self._status_poller, name="chrome-status", daemon=True
+        ).start()
+
+        # Release timers and connections when the window is closed
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
 
     def check_status(self):
         """Check if Chrome debugging is already running."""
         try:
             port = int(self.port_var.get())
-            if is_port_in_use(port):
-                self.status_label.config(
-                    text="✅ Chrome debugging is active", foreground="green"
-                )
-                self.debug_url_label.config(
-                    text=f"Debug interface: http://localhost:{port}"
-                )
-                self.open_debug_button.config(state="normal")
-                self.stop_button.config(state="normal")
-                self.focus_button.config(state="normal")
-                self.launch_button.config(text="Already Running")
-            else:
-                self.status_label.config(
-                    text="❌ Chrome debugging not detected", foreground="red"
-                )
-                self.debug_url_label.config(text="")
-                self.open_debug_button.config(state="disabled")
-                self.stop_button.config(state="disabled")
-                self.focus_button.config(state="disabled")
-                self.launch_button.config(text="Launch Chrome")
         except ValueError:
             messagebox.showerror("Error", "Please enter a valid port number")
+            return
+        self._show_status(port, force=True)
+
+    def _drain_ui_calls(self):
+        """Run callbacks queued by worker threads, and publish the port to poll."""
+        self._status_after_id = self.root.after(_UI_DRAIN_MS, self._drain_ui_calls)
+        try:
+            self._poll_port = int(self.port_var.get())
+        except ValueError:
+            self._poll_port = None
+        while True:
+            try:
+                callback, args = self._ui_calls.get_nowait()
+            except queue.Empty:
+                return
+            callback(*args)
+
+    def _status_poller(self):
+        """Probe the debug port once a second on this worker thread.
+
+        Asking for /json/version tells Chrome apart from any other listener,
+        and a wedged Chrome only stalls this thread, never the window.
+        """
+        client = _DevToolsClient()
+        try:
+            while not self._poll_stop.wait(STATUS_POLL_MS / 1000):
+                port = self._poll_port
+                if port is None or self._launching:
+                    continue
+                up = client.request(port, "/json/version") is not None
+                self._post(self._probe_done, port, up)
+        finally:
+            client.close()
+
+    def _post(self, callback, *args):
+        """Queue callback for the Tk thread; Tk itself is only touched there."""
+        if not self._closed:
+            self._ui_calls.put((callback, args))
+
+    def _probe_done(self, port, up):
+        """Show a background probe's result unless a launch or stop is under way."""
+        if self._launching:
+            return
+        if self._stop_deadline is not None:
+            # Keep showing a stopped Chrome as down while it is still exiting
+            if up and time.monotonic() < self._stop_deadline:
+                return
+            self._stop_deadline = None
+        self._render_status(("up" if up else "down", port))
+
+    def _show_status(self, port, force=False):
+        """Probe port and update the widgets."""
+        state = ("up" if self._cdp_tabs(port) is not None else "down", port)
+        self._render_status(state, force)
+
+    def _render_status(self, state, force=False):
+        """Update the widgets for (state, port), skipping Tk calls if nothing changed."""
+        port = state[1]
+        if state == self._last_state and not force:
+            return
+        self._last_state = state
+
+        if state[0] == "up":
+            self.status_label.config(
+                text="✅ Chrome debugging is active", foreground="green"
+            )
+            self.debug_url_label.config(
+                text=f"Debug interface: http://localhost:{port}"
+            )
+            self.open_debug_button.config(state="normal")
+            self.stop_button.config(state="normal")
+            self.focus_button.config(state="normal")
+            self.launch_button.config(text="Already Running")
+        else:
+            self.status_label.config(
+                text="❌ Chrome debugging not detected", foreground="red"
+            )
+            self.debug_url_label.config(text="")
+            self.open_debug_button.config(state="disabled")
+            self.stop_button.config(state="disabled")
+            self.focus_button.config(state="disabled")
+            self.launch_button.config(text="Launch Chrome")
 
     def launch_chrome(self):
         """Launch Chrome with debugging in a separate thread."""
         try:
             port = int(self.port_var.get())
-            user_data_dir = self.user_data_var.get().strip() or None
+            user_data_dir = (
+                self.user_data_var.get().strip() or f"/tmp/chrome-debug-{port}"
+            )
 
-            if is_port_in_use(port):
+            if self._cdp_tabs(port) is not None:
                 result = messagebox.askyesno(
                     "Chrome Already Running", 
                     f"Chrome is already running with debugging on port {port}.\n\n"
@@ -209,63 +690,56 @@ Benefits:
                     self.focus_chrome_window()
                 return
 
+            chrome_path = _chrome_path()
+            if not chrome_path:
+                messagebox.showerror(
+                    "Error", "Chrome not found. Please install Google Chrome."
+                )
+                return
+
+            self._launching = True
+            self._last_state = None
+            self._stop_deadline = None
+            self._chrome_pid = None
             self.status_label.config(text="🚀 Launching Chrome...", foreground="orange")
             self.launch_button.config(state="disabled")
 
-            def launch_thread():
-
-                chrome_path = find_chrome_path()
-                if not chrome_path:
-                    self.root.after(0, lambda: self.launch_complete(False))
-                    return
-
+            def launch_thread(chrome_path, user_data_dir):
                 # Set up user data directory
-                nonlocal user_data_dir
-                if not user_data_dir:
-                    user_data_dir = f"/tmp/chrome-debug-{port}"
-
-                Path(user_data_dir).mkdir(parents=True, exist_ok=True)
+                if not os.path.isdir(user_data_dir):
+                    Path(user_data_dir).mkdir(parents=True, exist_ok=True)
 
                 # Chrome launch arguments
                 args = [
                     chrome_path,
                     f"--remote-debugging-port={port}",
                     f"--user-data-dir={user_data_dir}",
-                    "--no-first-run",
-                    "--no-default-browser-check",
-                    "--disable-extensions",
-                    "--disable-plugins",
-                    "--disable-default-apps",
-                    "--disable-background-timer-throttling",
-                    "--disable-backgrounding-occluded-windows",
-                    "--disable-renderer-backgrounding",
-                    "--disable-features=TranslateUI",
-                    "--disable-ipc-flooding-protection",
-                    "--disable-web-security",
-                    "--disable-features=VizDisplayCompositor",
-                    "--disable-blink-features=AutomationControlled",
-                    "--no-sandbox",
+                    *CHROME_DEBUG_FLAGS,
                 ]
 
                 try:
-                    # Launch Chrome and store process reference
+                    # Launch Chrome and store process reference. Python's own
+                    # descriptors are non-inheritable, so keeping close_fds off
+                    # leaks nothing and lets CPython posix_spawn Chrome instead
+                    # of forking the whole GUI process.
                     self.chrome_process = subprocess.Popen(
-                        args, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+                        args,
+                        stdin=subprocess.DEVNULL,
+                        stdout=subprocess.DEVNULL,
+                        stderr=subprocess.DEVNULL,
+                        close_fds=False,
                     )
 
-                    # Wait for Chrome to start
-                    for i in range(10):
-                        time.sleep(1)
-                        if is_port_in_use(port):
-                            self.root.after(0, lambda: self.launch_complete(True))
-                            return
-
-                    self.root.after(0, lambda: self.launch_complete(False))
+                    # Wait for Chrome to start, stopping early if it exits
+                    started = _wait_for_debug_port(port, self.chrome_process)
+                    self._post(self.launch_complete, started)
                 except Exception as e:
                     logging.error(f"Failed to launch Chrome: {e}")
-                    self.root.after(0, lambda: self.launch_complete(False))
+                    self._post(self.launch_complete, False)
 
-            threading.Thread(target=launch_thread, daemon=True).start()
+            threading.Thread(
+                target=launch_thread, args=(chrome_path, user_data_dir), daemon=True
+            ).start()
 
         except ValueError:
             messagebox.showerror("Error", "Please enter a valid port number")
@@ -273,6 +747,8 @@ Benefits:
     def launch_complete(self, success):
         """Handle launch completion."""
         self.launch_button.config(state="normal")
+        self._launching = False
+        self._tabs_cache = None
         if success:
             self.check_status()
             messagebox.showinfo(
@@ -297,56 +773,49 @@ Benefits:
         """Stop the Chrome debug browser gracefully."""
         try:
             port = int(self.port_var.get())
-
-            # First try to close gracefully via CDP
-            try:
-                import requests
-
-                response = requests.get(f"http://localhost:{port}/json", timeout=2)
-                if response.status_code == 200:
-                    # Try to close all tabs first
-                    tabs = response.json()
-                    for tab in tabs:
-                        if "webSocketDebuggerUrl" in tab:
-                            try:
-                                requests.post(
-                                    f"http://localhost:{port}/json/close/{tab['id']}",
-                                    timeout=1,
-                                )
-                            except Exception:
-                                pass
-            except Exception:
-                pass
+            self._tabs_cache = None
+            self._chrome_pid = None
 
             # If we have the process reference, terminate it
             if self.chrome_process and self.chrome_process.poll() is None:
                 self.chrome_process.terminate()
-                # Wait a bit for graceful shutdown
-                time.sleep(2)
-                if self.chrome_process.poll() is None:
-                    self.chrome_process.kill()
+                # Allow a graceful shutdown without blocking the Tk event loop
+                checks = int(STOP_GRACE_PERIOD * 1000 // _EXIT_POLL_MS)
+                self._exit_checks[self.chrome_process] = self.root.after(
+                    _EXIT_POLL_MS, self._await_chrome_exit, self.chrome_process, checks
+                )
                 self.chrome_process = None
             else:
+                # Chrome was started elsewhere, so first close its tabs via CDP
+                try:
+                    body = self._cdp_request(port, "/json")
+                    if body is not None:
+                        # Close all tabs concurrently
+                        tab_ids = [
+                            match.group(1).decode()
+                            for match in _CLOSABLE_TAB_ID_RE.finditer(body)
+                        ]
+                        _close_tabs(port, tab_ids)
+                except Exception:
+                    pass
+
+                # Our own DevTools connection would list the launcher as a user
+                # of the port, so drop it before looking for owners
+                self._close_cdp_conn()
+
                 # Fallback: find and kill Chrome processes with our debug port
                 try:
-                    # Find processes using the debug port
-                    result = subprocess.run(
-                        ["lsof", "-ti", f":{port}"],
-                        capture_output=True,
-                        text=True,
-                        timeout=5,
+                    _terminate_pids(
+                        pid
+                        for pid in _port_owner_pids(port)
+                        if _is_chrome_name(_process_name(pid))
                     )
-                    if result.stdout.strip():
-                        pids = result.stdout.strip().split("\n")
-                        for pid in pids:
-                            try:
-                                subprocess.run(["kill", "-TERM", pid], timeout=2)
-                            except Exception:
-                                pass
                 except Exception:
                     pass
 
-            # Update UI
+            # Update UI, holding the down state until Chrome has had time to exit
+            self._stop_deadline = time.monotonic() + STOP_GRACE_PERIOD + 1
+            self._last_state = ("down", port)
             self.status_label.config(text="Chrome stopped", foreground="orange")
             self.debug_url_label.config(text="")
             self.open_debug_button.config(state="disabled")
@@ -361,29 +830,41 @@ Benefits:
         except Exception as e:
             messagebox.showerror("Error", f"Failed to stop Chrome: {e}")
             
+    def _await_chrome_exit(self, process, remaining):
+        """Poll a terminated Chrome, killing it once the grace period runs out.
+
+        ``remaining`` is None once SIGKILL has been sent, after which the
+        process is only polled until it has been reaped.
+        """
+        if process.poll() is not None:
+            self._exit_checks.pop(process, None)
+            return
+        if remaining is not None and remaining <= 0:
+            process.kill()
+            remaining = None
+        if remaining is None:
+            # Reap the killed process shortly afterwards
+            self._exit_checks[process] = self.root.after(
+                _EXIT_POLL_MS, self._await_chrome_exit, process, None
+            )
+            return
+        self._exit_checks[process] = self.root.after(
+            _EXIT_POLL_MS, self._await_chrome_exit, process, remaining - 1
+        )
+
     def focus_chrome_window(self):
         """Bring Chrome debug window to front and open a new tab."""
         try:
             port = int(self.port_var.get())
             
-            # First, try to open a new tab via CDP and navigate to a visible page
+            # First, try to open a new tab via CDP on a visible page
             try:
-                import requests
-                response = requests.post(f"http://localhost:{port}/json/new", timeout=2)
-                if response.status_code == 200:
-                    tab_info = response.json()
-                    
-                    # Navigate to a page to make the window visible
-                    tab_id = tab_info.get('id')
-                    if tab_id:
-                        navigate_response = requests.post(
-                            f"http://localhost:{port}/json/runtime/evaluate",
-                            json={
-                                "expression": "window.location.href = 'https://www.google.com';"
-                            },
-                            timeout=2
-                        )
-                    
+                body = self._cdp_request(
+                    port, "/json/new?https://www.google.com", method="PUT"
+                )
+                if body is not None:
+                    tab_info = json.loads(body)
+
                     # Now try to focus the specific Chrome process
                     self._focus_debug_chrome_process(port)
                     messagebox.showinfo(
@@ -414,104 +895,100 @@ Benefits:
         except Exception as e:
             messagebox.showerror("Error", f"Failed to focus Chrome window: {e}")
     
+    def _cdp_request(self, port, path, method="GET"):
+        """Send a request to Chrome's DevTools HTTP endpoint on the Tk thread's connection.
+
+        Returns the response body, or None if Chrome is unreachable or refuses.
+        """
+        return self._cdp.request(port, path, method)
+
+    def _close_cdp_conn(self):
+        """Close the Tk thread's kept-alive DevTools connection, if one is open."""
+        self._cdp.close()
+
+    def _cdp_tabs(self, port):
+        """Return Chrome's open targets on port, or None if it is not reachable."""
+        now = time.monotonic()
+        if self._tabs_cache is not None:
+            cached_port, fetched_at, tabs = self._tabs_cache
+            if cached_port == port and now - fetched_at < _TABS_CACHE_TTL:
+                return tabs
+        body = self._cdp_request(port, "/json")
+        try:
+            tabs = json.loads(body) if body is not None else None
+        except ValueError:
+            tabs = None
+        self._tabs_cache = (port, now, tabs)
+        return tabs
+
+    def _debug_chrome_pids(self, port):
+        """Return the PIDs of Chrome processes serving the debug port, cached per port."""
+        if self._chrome_pid is not None:
+            pid, cached_port = self._chrome_pid
+            if cached_port == port and _is_chrome_name(_process_name(pid)):
+                return [pid]
+            self._chrome_pid = None
+
+        pids = [
+            pid for pid in _port_owner_pids(port) if _is_chrome_name(_process_name(pid))
+        ]
+        if pids:
+            self._chrome_pid = (pids[0], port)
+        return pids
+
     def _focus_debug_chrome_process(self, port):
         """Focus the specific Chrome process running with debug port."""
         try:
-            print(f"DEBUG: Attempting to focus Chrome on port {port}")
-            
-            # Method 1: Use lsof to find the exact process using the debug port
-            result = subprocess.run(
-                ["lsof", "-ti", f":{port}"], 
-                capture_output=True, 
-                text=True, 
-                timeout=5
-            )
-            
-            print(f"DEBUG: lsof result: '{result.stdout.strip()}'")
-            
-            if result.stdout.strip():
-                pids = result.stdout.strip().split('\n')
-                print(f"DEBUG: Found PIDs: {pids}")
-                for pid in pids:
-                    try:
-                        # Get process info to confirm it's Chrome
-                        ps_result = subprocess.run(
-                            ["ps", "-p", pid, "-o", "comm="], 
-                            capture_output=True, 
-                            text=True, 
-                            timeout=2
-                        )
-                        print(f"DEBUG: PID {pid} process: '{ps_result.stdout.strip()}'")
-                        if "Chrome" in ps_result.stdout or "chrome" in ps_result.stdout:
-                            print(f"DEBUG: Attempting to focus Chrome PID {pid}")
-                            # Use AppleScript to focus this specific process
-                            applescript = f'''
-                            tell application "System Events"
-                                set chromeProcess to first process whose unix id is {pid}
-                                set frontmost of chromeProcess to true
-                            end tell
-                            '''
-                            applescript_result = subprocess.run(["osascript", "-e", applescript], 
-                                                               capture_output=True, text=True, timeout=5)
-                            print(f"DEBUG: AppleScript result: {applescript_result.returncode}, stderr: {applescript_result.stderr}")
-                            if applescript_result.returncode == 0:
-                                print(f"DEBUG: Successfully focused Chrome PID {pid}")
-                                return True
-                    except Exception as e:
-                        print(f"DEBUG: Error with PID {pid}: {e}")
-                        continue
-            
+            logging.debug("Attempting to focus Chrome on port %s", port)
+
+            # Method 1: Find the Chrome process that owns the debug port
+            pids = self._debug_chrome_pids(port)
+            logging.debug("Found Chrome PIDs on port %s: %s", port, pids)
+            if any(_focus_pid(pid) for pid in pids):
+                return True
+
             # Method 2: Try to find Chrome with remote debugging argument
-            print(f"DEBUG: Method 1 failed, trying Method 2 - searching ps aux")
-            ps_result = subprocess.run(
-                ["ps", "aux"], 
-                capture_output=True, 
-                text=True, 
-                timeout=5
-            )
-            
-            print(f"DEBUG: Searching for remote-debugging-port={port} in process list")
-            for line in ps_result.stdout.split('\n'):
-                if f"remote-debugging-port={port}" in line and "Chrome" in line:
-                    print(f"DEBUG: Found Chrome debug process: {line}")
-                    # Extract PID (second column)
-                    parts = line.split()
-                    if len(parts) > 1:
-                        pid = parts[1]
-                        print(f"DEBUG: Extracted PID: {pid}")
-                        try:
-                            applescript = f'''
-                            tell application "System Events"
-                                set chromeProcess to first process whose unix id is {pid}
-                                set frontmost of chromeProcess to true
-                            end tell
-                            '''
-                            applescript_result = subprocess.run(["osascript", "-e", applescript], 
-                                                               capture_output=True, text=True, timeout=5)
-                            print(f"DEBUG: Method 2 AppleScript result: {applescript_result.returncode}, stderr: {applescript_result.stderr}")
-                            if applescript_result.returncode == 0:
-                                print(f"DEBUG: Successfully focused Chrome via Method 2")
-                                return True
-                        except Exception as e:
-                            print(f"DEBUG: Method 2 error: {e}")
-                            continue
-            
+            logging.debug("No port owner focused, searching the process list")
+            if any(_focus_pid(pid) for pid in _chrome_pids_with_debug_flag(port)):
+                return True
+
             # Method 3: Fallback to generic Chrome activation
-            print(f"DEBUG: Method 2 failed, trying Method 3 - generic Chrome activation")
-            applescript = '''
-            tell application "Google Chrome"
-                activate
-            end tell
-            '''
-            applescript_result = subprocess.run(["osascript", "-e", applescript], 
-                                               capture_output=True, text=True, timeout=5)
-            print(f"DEBUG: Method 3 AppleScript result: {applescript_result.returncode}, stderr: {applescript_result.stderr}")
+            logging.debug("Falling back to activating Google Chrome")
+            applescript_result = _run_applescript(_ACTIVATE_CHROME_APPLESCRIPT)
+            logging.debug(
+                "Chrome activation exited %s: %s",
+                applescript_result.returncode,
+                applescript_result.stderr,
+            )
             return True
-            
+
         except Exception as e:
             logging.error(f"Failed to focus Chrome process: {e}")
             return False
 
+    def _on_close(self):
+        """Cancel pending callbacks and tear down the window.
+
+        A Chrome launched from here keeps running so its logged-in session
+        stays available to the scraper. One already being stopped is handed
+        to a timer, so it is still killed if it ignores SIGTERM.
+        """
+        self._closed = True
+        self._poll_stop.set()
+        if self._status_after_id is not None:
+            self.root.after_cancel(self._status_after_id)
+            self._status_after_id = None
+        for process, after_id in self._exit_checks.items():
+            self.root.after_cancel(after_id)
+            if process.poll() is None:
+                threading.Timer(
+                    STOP_GRACE_PERIOD, _kill_if_running, args=(process,)
+                ).start()
+        self._exit_checks.clear()
+        self._close_cdp_conn()
+        self.root.quit()
+        self.root.destroy()
+
     def run(self):
         """Run the GUI."""
         self.root.mainloop()
@@ -3354,7 +3354,7 @@ class OllamaGUI(tk.Tk):
             self.update_idletasks()
 
             # Analyze the login form
-            selectors = analyze_login_form_sync(url)
+            selectors = analyze_login_form_sync(url, use_cache=False)
 
             if "error" in selectors:
                 if selectors.get("manual_mode"):
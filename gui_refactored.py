@@ -294,7 +294,7 @@ class OllamaGUI(tk.Tk):
         try:
             self.ui.analyze_button.config(text="Analyzing...", state="disabled")
             logging.info("Starting login form analysis...")
-            selectors = analyze_login_form_sync(url)
+            selectors = analyze_login_form_sync(url, use_cache=False)
 
             if "error" in selectors:
                 logging.warning(f"Login form analysis encountered error: {selectors.get('error', 'Unknown error')}")
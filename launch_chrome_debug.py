@@ -4,13 +4,31 @@ Helper script to launch Chrome with remote debugging enabled on Mac.
 This allows the authenticated scraper to connect to an existing browser session.
 """
 
+import http.client
 import os
 import subprocess
 import sys
 import time
-import requests
 from pathlib import Path
 
+# Flags passed to every debug Chrome after the port and profile directory
+CHROME_DEBUG_FLAGS = (
+    "--no-first-run",
+    "--no-default-browser-check",
+    "--disable-extensions",
+    "--disable-plugins",
+    "--disable-default-apps",
+    "--disable-background-timer-throttling",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-renderer-backgrounding",
+    "--disable-features=TranslateUI",
+    "--disable-ipc-flooding-protection",
+    "--disable-web-security",
+    "--disable-features=VizDisplayCompositor",
+    "--disable-blink-features=AutomationControlled",
+    "--no-sandbox",
+)
+
 
 def find_chrome_path():
     """Find Chrome installation path on Mac."""
@@ -30,11 +48,14 @@ def find_chrome_path():
 
 def is_port_in_use(port):
     """Check if a port is already in use."""
+    conn = http.client.HTTPConnection("localhost", port, timeout=2)
     try:
-        response = requests.get(f"http://localhost:{port}/json", timeout=2)
-        return response.status_code == 200
-    except:
+        conn.request("GET", "/json")
+        return conn.getresponse().status == 200
+    except (OSError, http.client.HTTPException):
         return False
+    finally:
+        conn.close()
 
 
 def launch_chrome_with_debugging(port=9222, user_data_dir=None):
@@ -63,20 +84,7 @@ def launch_chrome_with_debugging(port=9222, user_data_dir=None):
         "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
         f"--remote-debugging-port={port}",
         f"--user-data-dir={user_data_dir}",
-        "--no-first-run",
-        "--no-default-browser-check",
-        "--disable-extensions",
-        "--disable-plugins", 
-        "--disable-default-apps",
-        "--disable-background-timer-throttling",
-        "--disable-backgrounding-occluded-windows",
-        "--disable-renderer-backgrounding",
-        "--disable-features=TranslateUI",
-        "--disable-ipc-flooding-protection",
-        "--disable-web-security",
-        "--disable-features=VizDisplayCompositor",
-        "--disable-blink-features=AutomationControlled",
-        "--no-sandbox",
+        *CHROME_DEBUG_FLAGS,
         "https://www.google.com"  # Open with a default page to ensure window is visible
     ]
     
@@ -0,0 +1,58 @@
+"""Tests for the Chrome debug launcher helpers."""
+
+import json
+
+import pytest
+
+pytest.importorskip("tkinter")
+
+from browser_launcher import _CLOSABLE_TAB_ID_RE  # noqa: E402
+
+
+def _tab_ids(targets) -> list:
+    """Run the regex over a /json listing serialized the way Chrome sends it."""
+    body = json.dumps(targets, indent=3).encode()
+    return [match.group(1).decode() for match in _CLOSABLE_TAB_ID_RE.finditer(body)]
+
+
+def test_ids_of_targets_with_a_debugger_url():
+    targets = [
+        {"id": "A1", "type": "page", "webSocketDebuggerUrl": "ws://x/A1"},
+        {"id": "B2", "type": "page", "webSocketDebuggerUrl": "ws://x/B2"},
+    ]
+    assert _tab_ids(targets) == ["A1", "B2"]
+
+
+def test_targets_already_attached_are_skipped():
+    targets = [
+        {"id": "A1", "type": "page"},
+        {"id": "B2", "type": "page", "webSocketDebuggerUrl": "ws://x/B2"},
+    ]
+    assert _tab_ids(targets) == ["B2"]
+
+
+@pytest.mark.parametrize(
+    "title",
+    [
+        'Braces } and { in a title',
+        'Quoted "webSocketDebuggerUrl" in a title',
+        'Escaped \\" quote }',
+        '"id": "FAKE"',
+    ],
+)
+def test_titles_cannot_end_or_forge_a_target(title):
+    targets = [
+        {"id": "A1", "title": title, "type": "page"},
+        {"id": "B2", "title": title, "webSocketDebuggerUrl": "ws://x/B2"},
+    ]
+    assert _tab_ids(targets) == ["B2"]
+
+
+def test_compact_listing():
+    body = b'[{"id":"A1","webSocketDebuggerUrl":"ws://x/A1"},{"id":"B2"}]'
+    ids = [m.group(1).decode() for m in _CLOSABLE_TAB_ID_RE.finditer(body)]
+    assert ids == ["A1"]
+
+
+def test_empty_listing():
+    assert _tab_ids([]) == []
@@ -0,0 +1,100 @@
+"""Tests for pulling JSON objects out of LLM replies."""
+
+import json
+
+import pytest
+
+pytest.importorskip("bs4")
+pytest.importorskip("playwright")
+
+from authenticated_scraper import (  # noqa: E402
+    _JSON_FIX_RE,
+    _balanced_objects,
+    _find_json_object,
+    _read_until_json_object,
+)
+
+
+def _stream(chunks):
+    """Yield chunks like the Ollama helper, recording whether it was closed."""
+    state = {"read": 0, "closed": False}
+
+    def gen():
+        try:
+            for chunk in chunks:
+                state["read"] += 1
+                yield chunk
+        finally:
+            state["closed"] = True
+
+    return gen(), state
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("no braces here", []),
+        ('{"a": 1}', ['{"a": 1}']),
+        ('x {"a": {"b": 2}} y', ['{"a": {"b": 2}}', '{"b": 2}']),
+        ('{"a": "}"} {"b": 1}', ['{"a": "}"}', '{"b": 1}']),
+        ('{"a": "\\"}"}', ['{"a": "\\"}"}']),
+        ('{"a": 1', []),
+    ],
+)
+def test_balanced_objects(text, expected):
+    assert list(_balanced_objects(text)) == expected
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ('Here you go: {"username": "#u"} thanks', '{"username": "#u"}'),
+        ('{not json} then {"ok": true}', '{"ok": true}'),
+        ("{broken", None),
+        ("", None),
+    ],
+)
+def test_find_json_object(text, expected):
+    assert _find_json_object(text) == expected
+
+
+def test_read_until_json_object_stops_after_first_object():
+    stream, state = _stream(
+        ['Sure! {"a": ', '"x}"', ', "b": {"c": 1}}', " trailing", " prose"]
+    )
+    text = _read_until_json_object(stream)
+    assert _find_json_object(text) == '{"a": "x}", "b": {"c": 1}}'
+    assert state["read"] == 3
+    assert state["closed"]
+
+
+def test_read_until_json_object_returns_everything_without_an_object():
+    stream, state = _stream(["no ", "json ", "here"])
+    assert _read_until_json_object(stream) == "no json here"
+    assert state["closed"]
+
+
+def test_read_until_json_object_skips_unparseable_objects():
+    stream, _ = _stream(["{bad} ", '{"good": 1}', " more"])
+    text = _read_until_json_object(stream)
+    assert text.endswith('{"good": 1}')
+
+
+@pytest.mark.parametrize(
+    "broken, repaired",
+    [
+        ('{"a": "foo")}', '{"a": "foo"}'),
+        ('{"a": "foo" )}', '{"a": "foo"}'),
+        ('{"a": "x")  , "b": "y"}', '{"a": "x", "b": "y"}'),
+        ('{"a": "x"),"b": "y"}', '{"a": "x","b": "y"}'),
+        ('{"a": "x") "', '{"a": "x""'),
+        ('{"a": "(kept)"}', '{"a": "(kept)"}'),
+    ],
+)
+def test_json_fix_repairs_stray_parentheses(broken, repaired):
+    assert _JSON_FIX_RE.sub(r'"\1', broken) == repaired
+
+
+def test_json_fix_output_parses():
+    fixed = _JSON_FIX_RE.sub(r'"\1', '{"username": "#email" ), "password": "#pw" )}')
+    assert json.loads(fixed) == {"username": "#email", "password": "#pw"}
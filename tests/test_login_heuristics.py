@@ -0,0 +1,82 @@
+"""Tests for reading login selectors straight off simple forms."""
+
+import pytest
+
+pytest.importorskip("bs4")
+pytest.importorskip("playwright")
+
+from authenticated_scraper import _heuristic_login_selectors  # noqa: E402
+
+
+def test_simple_form_by_id():
+    html = """
+    <form>
+      <input type="email" id="email">
+      <input type="password" id="pass">
+      <button type="submit" id="go">Sign in</button>
+    </form>
+    """
+    assert _heuristic_login_selectors(html) == {
+        "username": "#email",
+        "password": "#pass",
+        "submit": "#go",
+    }
+
+
+def test_falls_back_to_name_and_generic_submit():
+    html = """
+    <form>
+      <input name="user">
+      <input type="password" name="pw">
+      <input type="submit" value="Log in">
+    </form>
+    """
+    assert _heuristic_login_selectors(html) == {
+        "username": "input[name='user']",
+        "password": "input[name='pw']",
+        "submit": "input[type='submit']",
+    }
+
+
+def test_username_is_the_nearest_text_input_before_the_password():
+    html = """
+    <input type="search" name="q">
+    <input type="text" name="first">
+    <input type="hidden" name="csrf">
+    <input type="email" name="login">
+    <input type="password" name="pw">
+    <button type="submit" name="go">Go</button>
+    """
+    assert _heuristic_login_selectors(html)["username"] == "input[name='login']"
+
+
+def test_id_not_usable_as_css_identifier_uses_name():
+    html = """
+    <input type="text" id="1user" name="user">
+    <input type="password" id="pw">
+    <button type="submit" id="go">Go</button>
+    """
+    assert _heuristic_login_selectors(html)["username"] == "input[name='user']"
+
+
+@pytest.mark.parametrize(
+    "html",
+    [
+        # Registration forms with a confirmation field are ambiguous
+        '<input name="u"><input type="password" name="a">'
+        '<input type="password" name="b"><button type="submit">Go</button>',
+        # No password field at all
+        '<input name="u"><button type="submit">Go</button>',
+        # Nothing to type the username into
+        '<input type="password" name="pw"><button type="submit">Go</button>',
+        # No explicit submit control
+        '<input name="u"><input type="password" name="pw"><button>Go</button>',
+        # More than one submit control
+        '<input name="u"><input type="password" name="pw">'
+        '<button type="submit">A</button><button type="submit">B</button>',
+        # Controls with neither a usable id nor a name
+        '<input type="text"><input type="password"><button type="submit">Go</button>',
+    ],
+)
+def test_ambiguous_forms_are_left_to_the_model(html):
+    assert _heuristic_login_selectors(html) is None
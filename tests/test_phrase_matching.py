@@ -0,0 +1,50 @@
+"""Tests for the single-pass phrase matcher used on page content."""
+
+import pytest
+
+pytest.importorskip("bs4")
+pytest.importorskip("playwright")
+
+import authenticated_scraper  # noqa: E402
+from authenticated_scraper import _PhraseMatcher  # noqa: E402
+
+_BACKENDS = ["regex"]
+if authenticated_scraper.ahocorasick is not None:
+    _BACKENDS.append("ahocorasick")
+
+
+@pytest.fixture(params=_BACKENDS)
+def make_matcher(request, monkeypatch):
+    """Build matchers on the Aho-Corasick automaton and on the regex fallback."""
+    if request.param == "regex":
+        monkeypatch.setattr(authenticated_scraper, "ahocorasick", None)
+    return _PhraseMatcher
+
+
+def test_search_ignores_case(make_matcher):
+    matcher = make_matcher(("sign in", "captcha"))
+    assert matcher.search("Please SIGN IN to continue")
+    assert not matcher.search("Welcome back")
+
+
+def test_matches_reports_declaration_order(make_matcher):
+    matcher = make_matcher(("captcha", "cloudflare", "please verify"))
+    text = "Cloudflare says: Please verify the CAPTCHA"
+    assert matcher.matches(text) == ["captcha", "cloudflare", "please verify"]
+
+
+def test_matches_includes_prefix_phrases(make_matcher):
+    matcher = make_matcher(("captcha", "recaptcha", "re"))
+    assert matcher.matches("load recaptcha.js") == ["captcha", "recaptcha", "re"]
+
+
+def test_matches_includes_overlapping_phrases(make_matcher):
+    matcher = make_matcher(("verification code", "code", "authentication"))
+    text = "Enter the verification code from your authentication app"
+    assert matcher.matches(text) == ["verification code", "code", "authentication"]
+
+
+def test_matches_empty_text(make_matcher):
+    matcher = make_matcher(("login",))
+    assert matcher.matches("") == []
+    assert not matcher.search("")
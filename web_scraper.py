@@ -8,6 +8,17 @@ from urllib.parse import urljoin, urlparse
 import requests
 from bs4 import BeautifulSoup
 
+# Page chrome removed before extracting text, matched in one tree walk
+_UNWANTED_SELECTOR = "nav, footer, aside, script, style, header, menu"
+
+# Any whitespace run containing a newline, i.e. line padding plus blank lines
+_LINE_BREAKS_RE = re.compile(r"\s*\n\s*")
+
+
+def clean_text(text: str) -> str:
+    """Strip every line and drop blank ones in a single regex pass."""
+    return _LINE_BREAKS_RE.sub("\n", text).strip()
+
 
 def scrape_web_content(url: str, timeout: int = 10) -> Dict[str, str]:
     """
@@ -64,25 +75,20 @@ def _extracted_from_scrape_web_content_(url, timeout):
     soup = BeautifulSoup(response.content, "html.parser")
 
     # Remove unwanted elements
-    unwanted_tags = ["nav", "footer", "aside", "script", "style", "header", "menu"]
     removed_count = 0
-    for tag in soup(unwanted_tags):
+    for tag in soup.select(_UNWANTED_SELECTOR):
         tag.decompose()
         removed_count += 1
     logging.info(f"Removed {removed_count} unwanted HTML elements")
 
-    text_content = (
-        main_content.get_text(separator="\n", strip=True)
-        if (
-            main_content := soup.find("main")
-            or soup.find("article")
-            or soup.find("div", class_=re.compile(r"content|main|body"))
-        )
-        else soup.get_text(separator="\n", strip=True)
+    main_content = (
+        soup.find("main")
+        or soup.find("article")
+        or soup.find("div", class_=re.compile(r"content|main|body"))
     )
+    text_content = "\n".join((main_content or soup).stripped_strings)
     # Clean up the text
-    lines = [line.strip() for line in text_content.split("\n") if line.strip()]
-    clean_content = "\n".join(lines)
+    clean_content = clean_text(text_content)
     logging.info(f"Extracted and cleaned {len(clean_content):,} characters of text content")
 
     if not clean_content: